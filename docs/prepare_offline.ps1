@@ -20,7 +20,6 @@ python -m pip download `
     pymcprotocol `
     python-dotenv `
     streamlit `
-    streamlit-autorefresh `
     --platform manylinux_2_17_aarch64 `
     --platform manylinux_2_28_aarch64 `
     --only-binary=:all: `
@@ -28,7 +28,7 @@ source .venv/bin/activate
 
 # 2. パッケージのインストール (オフライン)
 echo -e "${GREEN}[2/5] パッケージをインストール中...${NC}"
-pip install --no-index --find-links=packages plotly pydantic-settings pymcprotocol python-dotenv streamlit streamlit-autorefresh
+pip install --no-index --find-links=packages plotly pydantic-settings pymcprotocol python-dotenv streamlit
 
 # 3. .envファイルの作成
 echo -e "${GREEN}[3/5] 環境変数ファイルをセットアップ中...${NC}"
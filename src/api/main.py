@@ -25,17 +25,21 @@ load_dotenv()
 from api.routes import production, system
 from api.services.plc_service import plc_service
 from backend.logging import api_logger as logger
+from config.production_config import ProductionConfigManager
+from config.settings import get_settings
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """アプリケーションのライフサイクル管理
 
-    起動時: PLC接続を初期化
+    起動時: 機種マスタの読み込み、PLC接続を初期化
     終了時: PLC接続を安全に切断
     """
     # 起動時
     logger.info("API Server starting...")
+    # 機種マスタは起動時に1回だけ読み込む (初回リクエストでの遅延読み込みを避ける)
+    ProductionConfigManager.initialize(get_settings().LINE_NAME)
     plc_service.initialize()
 
     yield
@@ -71,12 +75,13 @@ async def root() -> dict[str, str]:
     }
 
 
-@app.get("/health", tags=["health"])
+@app.api_route("/health", methods=["GET", "HEAD"], tags=["health"])
 async def health_check() -> dict[str, str | int]:
     """ヘルスチェック (軽量)
 
     PLC通信は行わず、APIプロセスの生存確認のみを行う。
     Watchdogからの監視用エンドポイント。
+    HEADの場合はステータスコードのみ返す (フロントエンドの生存確認用)。
 
     Returns:
         {"status": "ok", "pid": <プロセスID>}
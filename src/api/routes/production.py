@@ -54,7 +54,7 @@ async def get_production() -> ProductionResponse:
         HTTPException: PLC通信エラー時 (500)
     """
     try:
-        data = plc_service.get_production_data()
+        data = await plc_service.aget_production_data()
         return ProductionResponse(
             line_name=data.line_name,
             production_type=data.production_type,
@@ -13,12 +13,12 @@ from pydantic import BaseModel
 from api.services.plc_service import plc_service
 from backend.system_utils import set_system_clock
 from backend.logging import api_logger as logger
-from config.settings import Settings
+from config.settings import get_settings
 
 router = APIRouter()
 
 # 設定読み込み
-_settings = Settings()
+_settings = get_settings()
 
 
 class SyncTimeResponse(BaseModel):
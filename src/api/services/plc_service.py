@@ -9,6 +9,7 @@ PLCClientをラップし、APIサーバー内で一元管理するシングル
 - 連続失敗回数が閾値を超えるとプロセス終了
 """
 
+import asyncio
 import os
 import random
 import signal
@@ -16,11 +17,13 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from backend.logging import api_logger as logger
 from backend.config_helpers import get_use_plc, get_config_data
 from config.settings import Settings
+from schemas import ProductionData
 
 
 class PLCCommunicationTimeoutError(Exception):
@@ -59,6 +62,13 @@ class PLCService:
         self._last_update: datetime | None = None
         self._access_lock = threading.Lock()
 
+        # 直近の生産データ (同時に表示している複数画面の要求をPLC読み取り1回にまとめる)
+        # 再利用期間は更新間隔の半分:
+        # 画面1台なら毎回読み取り、複数台でも更新間隔あたり最大2回
+        self._last_data: ProductionData | None = None
+        self._last_fetch_at = 0.0
+        self._reuse_window = float(self._settings.REFRESH_INTERVAL) / 2
+
         # タイムアウト設定
         self._fetch_timeout = self._settings.PLC_FETCH_TIMEOUT
         self._ping_timeout = self._settings.PLC_PING_TIMEOUT
@@ -73,7 +83,8 @@ class PLCService:
         # 遅延インポート用の関数参照
         self._fetch_production_data: Callable[..., Any] | None = None
         self._fetch_production_timestamp: Callable[..., datetime] | None = None
-        self._get_plc_device_dict: Callable[[], dict[str, str]] | None = None
+        self._get_plc_device_dict: Callable[[], Mapping[str, str]] | None = None
+        self._is_error_data: Callable[[ProductionData], bool] | None = None
 
         logger.info(
             f"PLCService initialized (USE_PLC={self._use_plc}, "
@@ -88,11 +99,13 @@ class PLCService:
             fetch_production_data,
             fetch_production_timestamp,
             get_plc_device_dict,
+            is_error_data,
         )
 
         self._fetch_production_data = fetch_production_data
         self._fetch_production_timestamp = fetch_production_timestamp
         self._get_plc_device_dict = get_plc_device_dict
+        self._is_error_data = is_error_data
 
         if self._use_plc:
             try:
@@ -335,7 +348,7 @@ class PLCService:
         # SIGTERMを自分自身に送信
         os.kill(os.getpid(), signal.SIGTERM)
 
-    def get_production_data(self) -> Any:
+    def get_production_data(self) -> ProductionData:
         """生産データを取得
 
         Returns:
@@ -344,22 +357,49 @@ class PLCService:
         Note:
             USE_PLC=false の場合はダミーデータを返す
             PLC通信はタイムアウト付きスレッドで実行
+            直近の取得から更新間隔の半分以内の要求には前回の結果を返す
+            (取得失敗時のデータは再利用せず、次の要求で再取得する)
         """
         with self._access_lock:
+            if (
+                self._last_data is not None
+                and time.monotonic() - self._last_fetch_at < self._reuse_window
+            ):
+                return self._last_data
+
             self._last_update = datetime.now()
 
             if self._use_plc and self._client is not None:
-                if self._fetch_production_data is None:
+                if self._fetch_production_data is None or self._is_error_data is None:
                     raise RuntimeError(
                         "PLCService not initialized. Call initialize() first."
                     )
-                return self._execute_with_timeout(
+                data = self._execute_with_timeout(
                     self._fetch_production_data,
                     "fetch_production_data",
                     self._client,
                 )
+                if self._is_error_data(data):
+                    return data
             else:
-                return self._generate_dummy_data()
+                data = self._generate_dummy_data()
+
+            # 再利用期間は取得完了時点から数える (通信時間で期間が短くならないように)
+            self._last_data = data
+            self._last_fetch_at = time.monotonic()
+            return data
+
+    async def aget_production_data(self) -> ProductionData:
+        """生産データを取得 (非同期版)
+
+        get_production_dataをワーカースレッドで実行し、PLC通信の待ち時間中も
+        イベントループを止めない。タイムアウト・連続失敗処理は同期版と共通。
+        PLC通信自体は同期APIのみ (1ソケットで直列化されるため非同期化の利点がない)。
+
+        Returns:
+            ProductionData: 生産データ
+        """
+        return await asyncio.to_thread(self.get_production_data)
 
     def get_plc_timestamp(self) -> datetime | None:
         """PLCから時刻を取得
@@ -410,9 +450,8 @@ class PLCService:
         """連続失敗カウンタをリセット (テスト用)"""
         self._consecutive_failures = 0
 
-    def _generate_dummy_data(self) -> Any:
+    def _generate_dummy_data(self) -> ProductionData:
         """ダミーデータを生成 (開発/テスト用)"""
-        from schemas import ProductionData
         from backend.calculators import calculate_remain_pallet
 
         # ダミーデータ生成用定数
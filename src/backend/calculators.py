@@ -5,10 +5,15 @@
 """
 
 from backend.config_helpers import get_config_data
+from schemas import ProductionTypeConfig
 
 
 def calculate_remain_pallet(
-    plan: int, actual: int, production_type: int, decimals: int | None = 2
+    plan: int,
+    actual: int,
+    production_type: int,
+    decimals: int | None = 2,
+    config: ProductionTypeConfig | None = None,
 ) -> float:
     """残りパレット数を計算する
 
@@ -17,24 +22,33 @@ def calculate_remain_pallet(
         actual: 実績生産数
         production_type: 機種番号 (0-15)
         decimals: 小数点以下の桁数 (Noneの場合は丸めない)
+        config: 取得済みの機種設定 (Noneの場合はproduction_typeから取得)
 
     Returns:
-        float: 残りパレット数
+        float: 残りパレット数 (実績が計画以上の場合は機種設定を参照せず0.0)
 
     Examples:
         >>> calculate_remain_pallet(plan=30000, actual=20000, production_type=1)
         3.57
     """
-    config = get_config_data(production_type)
+    # 計画達成済み (残り0) の場合は機種設定の取得・計算を省略
+    if plan <= actual:
+        return 0.0
 
-    remaining_units = max(0, plan - actual)
-    remain_pallet = remaining_units / config.fully
+    if config is None:
+        config = get_config_data(production_type)
+
+    remain_pallet = (plan - actual) * config.inv_fully
 
     return round(remain_pallet, decimals) if decimals is not None else remain_pallet
 
 
 def calculate_remain_minutes(
-    plan: int, actual: int, production_type: int, decimals: int | None = 2
+    plan: int,
+    actual: int,
+    production_type: int,
+    decimals: int | None = 2,
+    config: ProductionTypeConfig | None = None,
 ) -> float:
     """残り時間(分)を計算
 
@@ -43,18 +57,23 @@ def calculate_remain_minutes(
         actual: 実績数
         production_type: 機種番号
         decimals: 小数点以下の桁数 (Noneの場合は丸めない)
+        config: 取得済みの機種設定 (Noneの場合はproduction_typeから取得)
 
     Returns:
-        float: 残り時間(分)
+        float: 残り時間(分) (実績が計画以上の場合は機種設定を参照せず0.0)
 
     Examples:
         >>> calculate_remain_minutes(plan=30000, actual=20000, production_type=1)
         200.0
     """
-    config = get_config_data(production_type)
+    # 計画達成済み (残り0) の場合は機種設定の取得・計算を省略
+    if plan <= actual:
+        return 0.0
+
+    if config is None:
+        config = get_config_data(production_type)
 
-    remain = max(0, plan - actual)  # 計画超過時は0にクランプ
-    remain_seconds = remain * config.seconds_per_product  # 残り個数 × 1個あたりの秒数
-    remain_minute = remain_seconds / 60.0
+    remain = plan - actual
+    remain_minute = remain * config.minutes_per_product  # 残り個数 × 1個あたりの分数
 
     return round(remain_minute, decimals) if decimals is not None else remain_minute
@@ -5,11 +5,11 @@
 """
 
 from config.production_config import ProductionConfigManager
-from config.settings import LogLevel, Settings
+from config.settings import LogLevel, Theme, get_settings
 from schemas import ProductionTypeConfig
 
 # 設定のシングルトンインスタンス（モジュールレベルで1回だけ初期化）
-_settings = Settings()
+_settings = get_settings()
 
 # ProductionConfigManagerのシングルトンインスタンス（モジュールレベルで1回だけ初期化）
 _config_manager = ProductionConfigManager()
@@ -51,6 +51,15 @@ def get_log_level() -> LogLevel:
     return _settings.LOG_LEVEL
 
 
+def get_theme() -> Theme:
+    """UIテーマを取得
+
+    Returns:
+        Theme: UIテーマ (Enum)
+    """
+    return _settings.THEME
+
+
 def get_kiosk_mode() -> bool:
     """Kioskモード設定を取得
 
@@ -88,3 +97,20 @@ def get_config_data(production_type: int) -> ProductionTypeConfig:
         >>> print(config.fully)  # 2800
     """
     return _config_manager.get_config(production_type)
+
+
+def find_config_data(production_type: int) -> ProductionTypeConfig | None:
+    """指定された機種番号に対応する機種設定を取得する (例外を送出しない版)
+
+    Args:
+        production_type: 機種番号 (0-15)
+
+    Returns:
+        ProductionTypeConfig | None: 機種設定 (範囲外または未定義の場合はNone)
+
+    Examples:
+        >>> config = find_config_data(1)
+        >>> if config is None:
+        ...     print("未定義の機種")
+    """
+    return _config_manager.find_config(production_type)
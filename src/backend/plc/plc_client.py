@@ -1,17 +1,40 @@
+import array
+import atexit
+import struct
+import threading
 import time
 import socket
-from functools import wraps
+from functools import lru_cache, wraps
 from pymcprotocol import Type3E
+from pymcprotocol import mcprotocolconst as mc_const
 from .base import BasePLCClient
-from config.settings import Settings
+from .device_batch import RANDOM_READ_MAX_POINTS
+from config.settings import Settings, get_settings
 from backend.logging import plc_logger as logger
-from typing import Any, Callable, TypeAlias
+from backend.system_utils import restart_system
+from collections.abc import Sequence
+from typing import Any, Callable, Self, TypeAlias
 
 Func: TypeAlias = Callable[..., Any]
 
 # PLC通信タイムアウト設定（秒）
 PLC_SOCKET_TIMEOUT = 5  # ソケット読み書きタイムアウト
 
+# ensure_connectedのヘルスチェック省略期間（秒）
+# 直近この秒数以内に通信が成功していれば、SD0読み出しによる確認を行わない
+PLC_HEALTH_CHECK_INTERVAL = 10.0
+
+# MCプロトコル応答の受信バッファサイズ (pymcprotocolの_SOCKBUFSIZEと同じ)
+PLC_RECV_BUFFER_SIZE = 4096
+
+# デバイス名解析結果のキャッシュ件数
+# ランダム読み出し1回分の全点+一括読み出しの先頭デバイスが毎周期追い出されない大きさ
+PLC_DEVICE_CACHE_SIZE = RANDOM_READ_MAX_POINTS + 64
+
+# 符号付き変換をstructで一括処理するワード数の閾値
+# (これ未満はPythonのループの方がpack/unpackのオーバーヘッドより速い)
+SIGNED_BULK_THRESHOLD = 8
+
 
 def func_name(func: Func) -> str:
     """関数の名前を取得するユーティリティ関数
@@ -25,6 +48,28 @@ def func_name(func: Func) -> str:
     return getattr(func, "__name__", repr(func))
 
 
+def to_signed16(words: list[int]) -> list[int]:
+    """符号なし16ビットワードのリストを符号付きに変換する
+
+    ワード数がSIGNED_BULK_THRESHOLD以上の場合はstructで
+    一括再解釈し、Pythonレベルのループを避ける。
+
+    Args:
+        words: 符号なし16ビットワードのリスト (0-65535)
+
+    Returns:
+        list[int]: 符号付き16ビット値のリスト (-32768 ~ 32767)
+
+    Examples:
+        >>> to_signed16([0x0001, 0xFFFF])
+        [1, -1]
+    """
+    size = len(words)
+    if size >= SIGNED_BULK_THRESHOLD:
+        return list(struct.unpack(f"<{size}h", struct.pack(f"<{size}H", *words)))
+    return [word - 0x10000 if word >= 0x8000 else word for word in words]
+
+
 def auto_reconnect(func: Func) -> Func:
     """PLC通信エラー時に自動再接続を試みるデコレータ
 
@@ -53,10 +98,14 @@ def auto_reconnect(func: Func) -> Func:
             logger.error(f"Operation failed after reconnect attempts: {e}")
             if getattr(self.settings, "RECONNECT_RESTART", False) and func_name(
                 func
-            ) in ["read_words", "read_bits", "read_dwords"]:
+            ) in [
+                "read_words",
+                "read_words_raw",
+                "read_random_words",
+                "read_bits",
+                "read_dwords",
+            ]:
                 logger.critical("Reconnection failed. Restarting application...")
-                from backend.system_utils import restart_system
-
                 restart_system()
 
             raise
@@ -82,7 +131,7 @@ def debug_dummy_read(func: Func) -> Func:
         _func_name = func_name(func)
         if self.settings.DEBUG_DUMMY_READ:
             logger.debug(
-                f"Dummy read for {_func_name} with args: {args}, kwargs: {kwargs}"
+                "Dummy read for %s with args: %s, kwargs: %s", _func_name, args, kwargs
             )
             if _func_name == "read_words":
                 size = kwargs.get("size", args[1] if len(args) > 1 else 1)
@@ -93,6 +142,12 @@ def debug_dummy_read(func: Func) -> Func:
             elif _func_name == "read_dwords":
                 size = kwargs.get("size", args[1] if len(args) > 1 else 1)
                 return [0] * size  # ダミーのダブルワードデータ
+            elif _func_name == "read_words_raw":
+                size = kwargs.get("size", args[1] if len(args) > 1 else 1)
+                return bytes(size * 2)  # ダミーのバイト列
+            elif _func_name == "read_random_words":
+                devices = kwargs.get("devices", args[0] if args else ())
+                return [0] * len(devices)  # ダミーのワードデータ
         return func(self, *args, **kwargs)
 
     return wrapper
@@ -115,6 +170,8 @@ class PLCClient(BasePLCClient):
     """
 
     _instance: "PLCClient | None" = None
+    # 複数スレッドから同時に初回取得されても接続を1本に保つためのロック
+    _instance_lock = threading.Lock()
 
     def __init__(self, settings: Settings) -> None:
         """PLCClientを初期化し、自動的に接続を試みる
@@ -125,22 +182,42 @@ class PLCClient(BasePLCClient):
         self.plc = Type3E()
         # ソケットタイムアウトを設定（デフォルト2秒は短すぎる場合がある）
         self.plc.soc_timeout = PLC_SOCKET_TIMEOUT
+        # 受信バッファを1つだけ確保し、応答ごとの受信用バッファ生成を避ける
+        self._rxbuf = bytearray(PLC_RECV_BUFFER_SIZE)
+        self._rxview = memoryview(self._rxbuf)
+        self.plc._recv = self._recv_into_buffer
+        # デバイス名 → MCフレームのデバイス部(コード+番号)をキャッシュし、
+        # 読み取りごとの正規表現解析・辞書参照を省く
+        self._parse_device = lru_cache(maxsize=PLC_DEVICE_CACHE_SIZE)(
+            self.plc._make_devicedata
+        )
+        self.plc._make_devicedata = self._parse_device
+        # 解析結果はcommtype等に依存するため、アクセスオプション変更時に破棄する
+        self._plc_setaccessopt = self.plc.setaccessopt
+        self.plc.setaccessopt = self._setaccessopt
+        # 同一ソケットへの同時送受信で応答が混ざらないよう通信を直列化する
+        self._io_lock = threading.Lock()
+        # 最後に通信が成功した時刻 (time.monotonic、0.0は未通信)
+        self._last_io_ok = 0.0
         self.settings = settings
         self.connected = False
         self.connect()
 
-    def __del__(self) -> None:
-        """デストラクタ: インスタンス破棄時にPLC接続をクローズ
+    def __enter__(self) -> Self:
+        """コンテキストマネージャ開始 (テスト・スクリプト用)
 
-        メモリーリーク防止のため、ガベージコレクション時に自動的に切断する。
+        Returns:
+            PLCClient: 自身のインスタンス
         """
-        try:
-            if hasattr(self, "connected") and self.connected:
-                self.disconnect()
-                logger.debug("PLCClient cleaned up in destructor")
-        except Exception as e:
-            # デストラクタ内での例外は握りつぶす（Python仕様）
-            logger.warning(f"Error during PLCClient cleanup: {e}")
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """コンテキストマネージャ終了: PLC接続をクローズ
+
+        GC中のファイナライザ(__del__)ではなく、明示的なタイミングで切断する。
+        """
+        if self.connected:
+            self.disconnect()
 
     @classmethod
     def get_instance(cls, settings: Settings | None = None) -> "PLCClient":
@@ -153,11 +230,21 @@ class PLCClient(BasePLCClient):
             PLCClient: シングルトンインスタンス
         """
         if cls._instance is None:
-            if settings is None:
-                settings = Settings()
-            cls._instance = cls(settings)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    if settings is None:
+                        settings = get_settings()
+                    cls._instance = cls(settings)
+                    # プロセス終了時に確実に切断する (__del__はGC中に走るため使わない)
+                    atexit.register(cls._close_instance)
         return cls._instance
 
+    @classmethod
+    def _close_instance(cls) -> None:
+        """シングルトンインスタンスのPLC接続をクローズする (atexit用)"""
+        if cls._instance is not None and cls._instance.connected:
+            cls._instance.disconnect()
+
     def connect(self) -> bool:
         """PLCに接続する
 
@@ -171,6 +258,7 @@ class PLCClient(BasePLCClient):
         for attempt in range(self.settings.RECONNECT_RETRY):
             try:
                 self.plc.connect(str(self.settings.PLC_IP), self.settings.PLC_PORT)
+                self._parse_device.cache_clear()
                 # TCPキープアライブを有効化（long-lived connection対策）
                 self._enable_keepalive()
                 logger.info(
@@ -202,6 +290,42 @@ class PLCClient(BasePLCClient):
         self.connected = False
         return False
 
+    def _recv_into_buffer(self) -> bytes:
+        """MCプロトコル応答を事前確保したバッファに受信する
+
+        Type3E._recvの置き換え。受信用に毎回4KBのbytesを確保する代わりに
+        同じバッファへrecv_intoし、受信長分だけをbytesとして返す。
+
+        Returns:
+            bytes: 受信データ
+
+        Note:
+            pymcprotocolはread_cputype・echo_testやASCII通信時に受信データを
+            .decode()するため、memoryviewではなくbytesで返す。
+        """
+        return bytes(self._recv_view())
+
+    def _recv_view(self) -> memoryview:
+        """MCプロトコル応答を受信し、受信バッファのビューをそのまま返す
+
+        応答の解析を自前で行う読み取り処理 (read_words_raw) 専用のゼロコピー版。
+
+        Returns:
+            memoryview: 受信データのビュー (次の受信で上書きされる)
+        """
+        size = self.plc._sock.recv_into(self._rxview, PLC_RECV_BUFFER_SIZE)
+        return self._rxview[:size]
+
+    def _setaccessopt(self, *args: Any, **kwargs: Any) -> None:
+        """Type3E.setaccessoptの置き換え: 設定変更後にデバイス解析キャッシュを破棄する
+
+        Args:
+            *args: Type3E.setaccessoptへの位置引数
+            **kwargs: Type3E.setaccessoptへのキーワード引数
+        """
+        self._plc_setaccessopt(*args, **kwargs)
+        self._parse_device.cache_clear()
+
     def _enable_keepalive(self) -> None:
         """TCPキープアライブを有効化する
 
@@ -250,6 +374,7 @@ class PLCClient(BasePLCClient):
 
         finally:
             self.connected = False
+            self._last_io_ok = 0.0
 
     def reconnect(self) -> bool:
         """PLC接続を再確立する
@@ -273,6 +398,7 @@ class PLCClient(BasePLCClient):
                 self.disconnect()
                 # 直接PLC接続を試みる（connect()の内部リトライを避けるため）
                 self.plc.connect(str(self.settings.PLC_IP), self.settings.PLC_PORT)
+                self._parse_device.cache_clear()
                 self._enable_keepalive()  # TCPキープアライブを有効化
                 logger.info("Reconnect succeeded.")
                 self.connected = True
@@ -302,6 +428,8 @@ class PLCClient(BasePLCClient):
 
         長時間稼働時のコネクション切断対策。読み込み前に呼び出すことで
         staleなコネクションを検出・復旧する。
+        直近PLC_HEALTH_CHECK_INTERVAL秒以内に通信が成功していれば、
+        ヘルスチェックの往復を省略する。
 
         Returns:
             bool: 接続が有効（または再接続成功）ならTrue
@@ -310,11 +438,18 @@ class PLCClient(BasePLCClient):
             logger.warning("PLC not connected, attempting to reconnect...")
             return self.reconnect()
 
+        # 直近に通信が成功していればセッションは生きているため確認を省略
+        # (毎ポーリングのヘルスチェック往復を避ける)
+        if time.monotonic() - self._last_io_ok < PLC_HEALTH_CHECK_INTERVAL:
+            return True
+
         # 接続済みでも実際に通信できるか軽量チェック
         try:
             # SD0（CPUモデル名）を読む = 軽量なヘルスチェック
             # タイムアウトはsoc_timeout（5秒）で発生する
-            self.plc.batchread_wordunits("SD0", 1)
+            with self._io_lock:
+                self.plc.batchread_wordunits("SD0", 1)
+                self._last_io_ok = time.monotonic()
             return True
         except (ConnectionError, OSError, TimeoutError, socket.timeout) as e:
             logger.warning(f"PLC connection stale, reconnecting: {e}")
@@ -337,15 +472,19 @@ class PLCClient(BasePLCClient):
 
     @debug_dummy_read
     @auto_reconnect
-    def read_words(self, device_name: str, size: int = 1) -> list[int]:
+    def read_words(
+        self, device_name: str, size: int = 1, signed: bool = False
+    ) -> list[int]:
         """PLCからワードデバイスを読み取る
 
         Args:
             device_name: デバイス名 (例: "D100", "SD210")
             size: 読み取るワード数 (デフォルト: 1)
+            signed: Trueなら符号付き16ビット値として返す (デフォルト: False)
 
         Returns:
             list[int]: 読み取ったワードデータのリスト (length=size)
+                signed=Falseなら0-65535、Trueなら-32768 ~ 32767
 
         Raises:
             ConnectionError: PLC未接続または通信エラー時
@@ -355,11 +494,64 @@ class PLCClient(BasePLCClient):
             自動的に再接続を試みる (AUTO_RECONNECT=true時)。
         """
         self._ensure_connection()
-        data = self.plc.batchread_wordunits(device_name, size)
+        with self._io_lock:
+            data = self.plc.batchread_wordunits(device_name, size)
+            self._last_io_ok = time.monotonic()
         data = [word & 0xFFFF for word in data]  # 16ビットにマスク
-        logger.debug(f"Read words {device_name}: {data}")
+        if signed:
+            data = to_signed16(data)
+        logger.debug("Read words %s: %s", device_name, data)
         return data
 
+    @debug_dummy_read
+    @auto_reconnect
+    def read_words_raw(self, device_name: str, size: int = 1) -> bytes:
+        """PLCからワードデバイスをバイト列のまま読み取る
+
+        文字列データ等、バイト列として扱う値向け。応答をintのリストに
+        変換せず、受信した応答データ部をそのまま返す。
+
+        Args:
+            device_name: デバイス名 (例: "D700")
+            size: 読み取るワード数 (デフォルト: 1)
+
+        Returns:
+            bytes: 読み取ったデータ (length=size*2)
+                各ワードを上位バイト→下位バイトの順に並べたもの
+                (例: [0x4552, 0x524F] → b"ERRO")
+
+        Raises:
+            ConnectionError: PLC未接続または通信エラー時
+            ValueError: 応答データが要求ワード数に満たない場合
+        """
+        self._ensure_connection()
+        if self.plc.commtype != mc_const.COMMTYPE_BINARY:
+            # ASCII通信では応答が16進文字列のため、ワード値経由で組み立てる
+            with self._io_lock:
+                words = self.plc.batchread_wordunits(device_name, size)
+                self._last_io_ok = time.monotonic()
+            return struct.pack(f">{size}H", *(word & 0xFFFF for word in words))
+
+        plc = self.plc
+        subcommand = 0x0002 if plc.plctype == mc_const.iQR_SERIES else 0x0000
+        request = plc._make_commanddata(0x0401, subcommand)  # ワード単位一括読出し
+        request += plc._make_devicedata(device_name)
+        request += plc._encode_value(size)
+        with self._io_lock:
+            plc._send(plc._make_senddata(request))
+            recv = self._recv_view()
+            plc._check_cmdanswer(recv)
+            start = plc._get_answerdata_index()
+            # 受信バッファは次の受信で上書きされるため、ロック内でコピーする
+            words = array.array("H")
+            words.frombytes(recv[start : start + size * 2])
+            self._last_io_ok = time.monotonic()
+        if len(words) < size:
+            raise ValueError(f"expected {size} words, got {len(words)}")
+        # MCプロトコルのバイナリ応答はリトルエンディアンのため、ワードごとに入れ替える
+        words.byteswap()
+        return words.tobytes()
+
     @debug_dummy_read
     @auto_reconnect
     def read_bits(self, device_name: str, size: int = 1) -> list[int]:
@@ -380,8 +572,35 @@ class PLCClient(BasePLCClient):
             自動的に再接続を試みる (AUTO_RECONNECT=true時)。
         """
         self._ensure_connection()
-        data = self.plc.batchread_bitunits(device_name, size)
-        logger.debug(f"Read bits {device_name}: {data}")
+        with self._io_lock:
+            data = self.plc.batchread_bitunits(device_name, size)
+            self._last_io_ok = time.monotonic()
+        logger.debug("Read bits %s: %s", device_name, data)
+        return data
+
+    @debug_dummy_read
+    @auto_reconnect
+    def read_random_words(self, devices: Sequence[str]) -> list[int]:
+        """離れた位置にある複数のワードデバイスを1回の通信で読み取る
+
+        MCプロトコルのランダム読出し (コマンド0403) を使用する。
+        デバイス種別が異なる (例: DとSD) 範囲もまとめて読み取れる。
+
+        Args:
+            devices: デバイス名のリスト (例: ["D100", "D101", "SD210"])
+
+        Returns:
+            list[int]: 読み取ったワードデータのリスト (0-65535, devicesと同順)
+
+        Raises:
+            ConnectionError: PLC未接続または通信エラー時
+        """
+        self._ensure_connection()
+        with self._io_lock:
+            data, _ = self.plc.randomread(word_devices=devices, dword_devices=[])
+            self._last_io_ok = time.monotonic()
+        data = [word & 0xFFFF for word in data]  # 16ビットにマスク
+        logger.debug("Random read words %s: %s", devices, data)
         return data
 
     @debug_dummy_read
@@ -407,7 +626,9 @@ class PLCClient(BasePLCClient):
             リトルエンディアン形式で2ワードを32ビット整数に変換する。
         """
         self._ensure_connection()
-        data = self.plc.batchread_wordunits(device_name, size * 2)
+        with self._io_lock:
+            data = self.plc.batchread_wordunits(device_name, size * 2)
+            self._last_io_ok = time.monotonic()
         # 連続する2ワード(16ビット×2)を32ビット整数に変換
         # 例: [0x1234, 0x5678] → 0x56781234 (リトルエンディアン)
         dwords = [
@@ -422,7 +643,7 @@ class PLCClient(BasePLCClient):
             )
             for i in range(size)
         ]
-        logger.debug(f"Read dwords {device_name}: {dwords}")
+        logger.debug("Read dwords %s: %s", device_name, dwords)
         return dwords
 
 
@@ -6,14 +6,103 @@ PLCから各種データ(生産数、アラーム、タイムスタンプ等)を
 
 import math
 import socket
+import struct
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+from backend.calculators import calculate_remain_minutes, calculate_remain_pallet
+from backend.config_helpers import find_config_data, get_line_name
 from backend.logging import backend_logger as logger
+from backend.plc.device_batch import (
+    BITS_PER_WORD,
+    RANDOM_READ_MAX_POINTS,
+    ReadBlock,
+    build_read_blocks,
+    expand_bit_block_words,
+    expand_block_devices,
+    is_bit_device,
+    unpack_bit_words,
+)
 from backend.plc.plc_client import PLCClient
-from config.settings import PLCDeviceList
+from config.production_config import PRODUCTION_TYPE_MASK
+from config.settings import get_plc_devices
 from schemas import ProductionData
 
 # PLCデバイス設定のキャッシュ（モジュールレベルで1回だけ初期化）
-_plc_device_list = PLCDeviceList()
+_plc_device_list = get_plc_devices()
+
+# 各データ項目のデバイスアドレス (プロセス中不変のため属性参照を事前に解決)
+_TIME_DEVICE = _plc_device_list.TIME_DEVICE
+_PRODUCTION_TYPE_DEVICE = _plc_device_list.PRODUCTION_TYPE_DEVICE
+_PLAN_DEVICE = _plc_device_list.PLAN_DEVICE
+_ACTUAL_DEVICE = _plc_device_list.ACTUAL_DEVICE
+_ALARM_FLAG_DEVICE = _plc_device_list.ALARM_FLAG_DEVICE
+_ALARM_MSG_DEVICE = _plc_device_list.ALARM_MSG_DEVICE
+_IN_OPERATING_DEVICE = _plc_device_list.IN_OPERATING_DEVICE
+
+# get_plc_device_dictが返す読み取り専用の辞書 (呼び出しごとに生成しない)
+_PLC_DEVICE_DICT: Mapping[str, str] = MappingProxyType(
+    {
+        "TIME_DEVICE": _TIME_DEVICE,
+        "PRODUCTION_TYPE_DEVICE": _PRODUCTION_TYPE_DEVICE,
+        "PLAN_DEVICE": _PLAN_DEVICE,
+        "ACTUAL_DEVICE": _ACTUAL_DEVICE,
+        "ALARM_FLAG_DEVICE": _ALARM_FLAG_DEVICE,
+        "ALARM_MSG_DEVICE": _ALARM_MSG_DEVICE,
+        "IN_OPERATING_DEVICE": _IN_OPERATING_DEVICE,
+    }
+)
+
+# 取得失敗時の生産データに設定する異常メッセージ
+ERROR_ALARM_MSG = "PLC通信エラー"
+
+# PLC読み取り時に想定される例外 (通信エラー・応答データ不正)
+_PLC_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    OSError,
+    ValueError,
+    IndexError,
+    socket.timeout,
+)
+
+# 各データ項目の読み取り点数
+ALARM_MSG_WORDS = 16  # アラームメッセージ (1ワード2バイト、最大32バイト)
+TIMESTAMP_WORDS = 3  # 日時 (BCD形式 YMDhms)
+
+# アラームメッセージのワード列 → バイト列変換 (書式は固定のため事前コンパイル)
+_ALARM_MSG_STRUCT = struct.Struct(f">{ALARM_MSG_WORDS}H")
+
+# BCD1バイト (2桁) → 10進数の変換表 (bytes.translate用)
+# いずれかのニブルが10以上のバイトは_BCD_INVALIDに変換する
+_BCD_INVALID = 0xFF
+_BCD_BYTE_TO_INT = bytes(
+    (hi * 10 + lo) if hi < 10 and lo < 10 else _BCD_INVALID
+    for hi in range(16)
+    for lo in range(16)
+)
+
+# 直前に変換した日時ワードと変換結果 (_decode_timestamp用)
+_timestamp_cache: tuple[tuple[int, int, int], datetime] | None = None
+
+# 一括読み取り計画 (デバイス設定はプロセス中不変のためモジュールロード時に1回だけ構築)
+# 解析できないデバイス (空文字等) はブロックに含まれず、個別読み取りにフォールバックする
+_WORD_READ_BLOCKS, _ = build_read_blocks(
+    {
+        "production_type": (_PRODUCTION_TYPE_DEVICE, 1),
+        "plan": (_PLAN_DEVICE, 2),
+        "actual": (_ACTUAL_DEVICE, 2),
+        "alarm_msg": (_ALARM_MSG_DEVICE, ALARM_MSG_WORDS),
+        "timestamp": (_TIME_DEVICE, TIMESTAMP_WORDS),
+    }
+)
+_BIT_READ_BLOCKS, _ = build_read_blocks(
+    {
+        "in_operating": (_IN_OPERATING_DEVICE, 1),
+        "alarm": (_ALARM_FLAG_DEVICE, 1),
+    },
+    bits=True,
+)
 
 
 def _fetch_word(
@@ -41,9 +130,10 @@ def _fetch_word(
         else:
             data = client.read_words(device_address, size=1)
         return data[0]
-    except (ConnectionError, OSError, ValueError, IndexError, socket.timeout) as e:
+    except _PLC_ERRORS as e:
+        # 通信不安定時はこの経路が頻発するため、整形はログ出力時まで遅延させる
         logger.warning(
-            f"Failed to get {field_name} from PLC: {e}, using default {default}"
+            "Failed to get %s from PLC: %s, using default %s", field_name, e, default
         )
         return default
 
@@ -63,14 +153,14 @@ def _fetch_bit(
         default: エラー時のデフォルト値
 
     Returns:
-        bool: 取得したビット値
+        bool: 取得したビット値 (ワードデバイスの場合は値が0以外ならTrue)
     """
     try:
-        data = client.read_bits(device_address, size=1)
-        return bool(data[0])
-    except (ConnectionError, OSError, ValueError, IndexError, socket.timeout) as e:
+        return bool(_read_flags(client, device_address, size=1)[0])
+    except _PLC_ERRORS as e:
+        # 通信不安定時はこの経路が頻発するため、整形はログ出力時まで遅延させる
         logger.warning(
-            f"Failed to get {field_name} from PLC: {e}, using default {default}"
+            "Failed to get %s from PLC: %s, using default %s", field_name, e, default
         )
         return default
 
@@ -99,26 +189,50 @@ def fetch_production_timestamp(client: PLCClient, head_device: str) -> datetime:
 
     try:
         # SD210から3ワード読み取り
-        data = client.read_words(head_device, size=3)
+        data = client.read_words(head_device, size=TIMESTAMP_WORDS)
+    except _PLC_ERRORS as e:
+        # PLC接続エラー時は現在時刻を返す
+        logger.warning(f"Failed to get timestamp from PLC: {e}, using system time")
+        return datetime.now()
 
-        # BCD形式を10進数に変換
-        # 例: 0x2511 → "2511" → 年=25, 月=11
-        word1 = f"{data[0]:04x}"
-        Y = int("20" + word1[:2])  # 年: 先頭2桁 (20xx年)
-        M = int(word1[2:])  # 月: 後ろ2桁
+    return _decode_timestamp(data)
 
-        word2 = f"{data[1]:04x}"
-        D = int(word2[:2])  # 日: 先頭2桁
-        h = int(word2[2:])  # 時: 後ろ2桁
 
-        word3 = f"{data[2]:04x}"
-        m = int(word3[:2])  # 分: 先頭2桁
-        s = int(word3[2:])  # 秒: 後ろ2桁
+def _decode_timestamp(data: list[int]) -> datetime:
+    """BCD形式の日時ワード(YMDhms)をdatetimeに変換する
 
-        return datetime(Y, M, D, h, m, s)
+    Args:
+        data: 日時ワード (3ワード)
 
-    except (ConnectionError, OSError, ValueError, IndexError, socket.timeout) as e:
-        # PLC接続エラーまたはデータ変換エラー時は現在時刻を返す
+    Returns:
+        datetime: 変換した日時 (データ不正時はシステム時刻)
+    """
+    global _timestamp_cache
+    try:
+        w1, w2, w3 = key = (data[0], data[1], data[2])
+        if w1 == 0:
+            # 年月が00 = PLCの時計が未設定 (起動直後等)。変換せずシステム時刻を返す
+            logger.debug("PLC clock is not set, using system time")
+            return datetime.now()
+
+        # PLCの時計は1秒ごとにしか進まないため、前回と同じワードなら結果を再利用
+        cached = _timestamp_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # 3ワードを6バイトに並べ、bytes.translateで全桁を1回のC呼び出しで変換
+        # (例: 0x2511 → 年=25, 月=11)
+        values = struct.pack(">3H", w1, w2, w3).translate(_BCD_BYTE_TO_INT)
+        if _BCD_INVALID in values:
+            raise ValueError(f"invalid BCD words: {w1:#06x} {w2:#06x} {w3:#06x}")
+        Y, M, D, h, m, s = values
+
+        timestamp = datetime(2000 + Y, M, D, h, m, s)
+        _timestamp_cache = (key, timestamp)
+        return timestamp
+
+    except (ValueError, IndexError, struct.error) as e:
+        # データ変換エラー時は現在時刻を返す
         logger.warning(f"Failed to get timestamp from PLC: {e}, using system time")
         return datetime.now()
 
@@ -140,18 +254,44 @@ def fetch_production_type(client: PLCClient, device_address: str) -> int:
     """
     try:
         val = _fetch_word(client, device_address, "production type", default=0)
-        if val < 0 or val > 15:
-            logger.warning(
-                f"Production type {val} out of range (0-15), defaulting to 0"
-            )
-            return 0
     except Exception as e:
         logger.warning(f"Error fetching production type: {e}, defaulting to 0")
         return 0
 
+    return _validate_production_type(val)
+
+
+def _validate_production_type(val: int) -> int:
+    """機種番号の範囲チェック
+
+    Args:
+        val: PLCから読み取った機種番号
+
+    Returns:
+        int: 機種番号 (0-15の範囲外なら0)
+    """
+    # 0-15以外 (負数を含む) は下位4ビット以外にビットが立つ
+    if val & ~PRODUCTION_TYPE_MASK:
+        logger.warning(f"Production type {val} out of range (0-15), defaulting to 0")
+        return 0
     return val
 
 
+def _decode_dword(words: list[int]) -> int:
+    """連続する2ワードを符号付き32ビット整数に変換する
+
+    PLCClient.read_dwordsと同じくリトルエンディアン (下位ワードが先)。
+
+    Args:
+        words: 2ワード分のデータ
+
+    Returns:
+        int: 符号付き32ビット整数
+    """
+    value = ((words[1] & 0xFFFF) << 16) | (words[0] & 0xFFFF)
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
 def fetch_plan(client: PLCClient, device_address: str) -> int:
     """PLCから生産計画数を取得
 
@@ -270,26 +410,216 @@ def fetch_alarm_msg(client: PLCClient, device_address: str) -> str:
         >>> print(msg)  # "装置異常発生中"
     """
     try:
-        data = client.read_words(device_address, size=10)  # 10ワード分読み取り
-        # ワードデータを文字列に変換 (例: [0x414C, 0x4152] → "ALAR")
-        alarm_msg = "".join(chr((word >> 8) & 0xFF) + chr(word & 0xFF) for word in data)
-        alarm_msg = alarm_msg.rstrip("\x00")  # 末尾のNULL文字を削除
-        return alarm_msg
-    except (ConnectionError, OSError, ValueError, IndexError, socket.timeout) as e:
+        raw = client.read_words_raw(device_address, size=ALARM_MSG_WORDS)
+        return raw.split(b"\x00", 1)[0].decode("shift_jis", errors="replace")
+    except _PLC_ERRORS as e:
         logger.warning(
             f"Failed to get alarm message from PLC: {e}, using default empty string"
         )
         return ""  # 空文字をデフォルト値として返す
 
 
-def get_plc_device_dict() -> dict[str, str]:
+def _decode_alarm_msg(data: list[int]) -> str:
+    """アラームメッセージのワードデータを文字列に変換する
+
+    各ワードの上位バイト→下位バイトの順で1バイト文字列に並べ、
+    Shift_JISでデコードする。
+
+    Args:
+        data: アラームメッセージのワードデータ
+
+    Returns:
+        str: アラームメッセージ (最初のNULL文字以降は除去)
+    """
+    # ワードデータをビッグエンディアンで一括バイト列化 (例: [0x414C, 0x4152] → b"ALAR")
+    if len(data) == ALARM_MSG_WORDS:
+        buf = _ALARM_MSG_STRUCT.pack(*data)
+    else:
+        buf = struct.pack(f">{len(data)}H", *data)
+    return buf.split(b"\x00", 1)[0].decode("shift_jis", errors="replace")
+
+
+def _read_flags(client: PLCClient, device_name: str, size: int) -> list[int]:
+    """フラグ (ON/OFF) を読み取る
+
+    ビットデバイスはビット単位で読み取る。ワードデバイスに格納されたフラグは
+    1ワードが1つのフラグのため、ワード単位で読み取り値が0以外ならONとする。
+
+    Args:
+        client: PLCクライアント
+        device_name: 先頭デバイス名 (例: "M100", "D103")
+        size: 読み取る点数
+
+    Returns:
+        list[int]: フラグ値のリスト (0 or 1, length=size)
+    """
+    if is_bit_device(device_name):
+        return client.read_bits(device_name, size=size)
+    return [int(word != 0) for word in client.read_words(device_name, size=size)]
+
+
+def _read_batched(
+    client: PLCClient,
+    word_blocks: list[ReadBlock],
+    bit_blocks: list[ReadBlock],
+) -> dict[str, list[int]]:
+    """読み取りブロック単位でPLCからデータを一括取得する
+
+    ブロックが複数ある場合はビットブロックもワード単位に含めた
+    ランダム読出しで1回にまとめ、それ以外 (またはランダム読出し失敗時) は
+    ブロックごとに1回だけread_words/read_bitsを呼ぶ。
+    結果は各データ項目に切り分けて返す。
+
+    Args:
+        client: PLCクライアント
+        word_blocks: ワードデバイスの読み取りブロック
+        bit_blocks: ビットデバイスの読み取りブロック
+
+    Returns:
+        dict[str, list[int]]: データ項目名 → 読み取り値の辞書
+            (読み取りに失敗したブロックの項目は含まれない)
+    """
+    values: dict[str, list[int]] = {}
+    random_devices = _random_read_devices(tuple(word_blocks), tuple(bit_blocks))
+    if random_devices:
+        try:
+            _store_random_read(
+                values,
+                word_blocks,
+                bit_blocks,
+                client.read_random_words(random_devices),
+            )
+            return values
+        except _PLC_ERRORS as e:
+            _log_batch_failure([*word_blocks, *bit_blocks], e)
+        word_blocks = []
+
+    for blocks, read in (
+        (word_blocks, client.read_words),
+        (bit_blocks, partial(_read_flags, client)),
+    ):
+        for block in blocks:
+            try:
+                _store_blocks(
+                    values, (block,), read(block.head_device, size=block.size)
+                )
+            except _PLC_ERRORS as e:
+                _log_batch_failure((block,), e)
+    return values
+
+
+@lru_cache(maxsize=8)
+def _random_read_devices(
+    word_blocks: tuple[ReadBlock, ...], bit_blocks: tuple[ReadBlock, ...] = ()
+) -> tuple[str, ...]:
+    """読み取りブロック群をランダム読出し用のデバイス名に展開する
+
+    ワードブロックは1点ずつ、ビットブロックはビットデバイスなら16点 (1ワード) 単位、
+    ワードデバイス上のフラグなら1点ずつ指定する。
+    読み取り計画はプロセス中不変のため、展開結果はキャッシュされる。
+
+    Args:
+        word_blocks: ワードデバイスの読み取りブロック
+        bit_blocks: フラグ項目の読み取りブロック
+
+    Returns:
+        tuple[str, ...]: ワードブロック → ビットブロックの順に並べたデバイス名
+            (ブロックが合計1つ以下、または点数が上限を超える場合は空)
+    """
+    if len(word_blocks) + len(bit_blocks) < 2:
+        return ()
+    devices = tuple(
+        device for block in word_blocks for device in expand_block_devices(block)
+    ) + tuple(
+        device
+        for block in bit_blocks
+        for device in (
+            expand_bit_block_words(block)
+            if is_bit_device(block.head_device)
+            else expand_block_devices(block)
+        )
+    )
+    if len(devices) > RANDOM_READ_MAX_POINTS:
+        return ()
+    return devices
+
+
+def _store_random_read(
+    values: dict[str, list[int]],
+    word_blocks: Sequence[ReadBlock],
+    bit_blocks: Sequence[ReadBlock],
+    data: list[int],
+) -> None:
+    """ランダム読出しの結果を各データ項目に切り分けて格納する
+
+    Args:
+        values: 格納先の辞書 (データ項目名 → 読み取り値)
+        word_blocks: ワードデバイスの読み取りブロック
+        bit_blocks: フラグ項目の読み取りブロック
+        data: _random_read_devicesの順に読み取ったワード値
+
+    Raises:
+        ValueError: 読み取り点数が不足している場合
+    """
+    pos = sum(block.size for block in word_blocks)
+    _store_blocks(values, word_blocks, data[:pos])
+    for block in bit_blocks:
+        if is_bit_device(block.head_device):
+            count = -(-block.size // BITS_PER_WORD)  # 切り上げ
+            flags = unpack_bit_words(data[pos : pos + count], block.size)
+        else:
+            # ワードデバイス上のフラグは1ワード1点、0以外をONとする
+            count = block.size
+            flags = [int(word != 0) for word in data[pos : pos + count]]
+        _store_blocks(values, (block,), flags)
+        pos += count
+
+
+def _store_blocks(
+    values: dict[str, list[int]], blocks: Sequence[ReadBlock], data: list[int]
+) -> None:
+    """読み取ったデータを各データ項目に切り分けて格納する
+
+    Args:
+        values: 格納先の辞書 (データ項目名 → 読み取り値)
+        blocks: 読み取りブロック (dataにはブロック順に連結されている)
+        data: 読み取り結果
+
+    Raises:
+        ValueError: 読み取り点数が不足している場合
+    """
+    total = sum(block.size for block in blocks)
+    if len(data) < total:
+        raise ValueError(f"expected {total} points, got {len(data)}")
+    base = 0
+    for block in blocks:
+        for field in block.fields:
+            start = base + field.offset
+            values[field.name] = data[start : start + field.width]
+        base += block.size
+
+
+def _log_batch_failure(blocks: Sequence[ReadBlock], error: BaseException) -> None:
+    """一括読み取り失敗をログ出力する
+
+    Args:
+        blocks: 失敗した読み取りブロック
+        error: 発生した例外
+    """
+    targets = ", ".join(f"{b.head_device} (size={b.size})" for b in blocks)
+    logger.warning(
+        "Batch read %s failed: %s, falling back to per-field reads", targets, error
+    )
+
+
+def get_plc_device_dict() -> Mapping[str, str]:
     """PLCデバイスリスト設定を取得
 
     .envファイルから各データ項目のPLCデバイスアドレスを読み込み、
     辞書形式で返す。モジュールレベルでキャッシュされる。
 
     Returns:
-        dict[str, str]: PLCデバイスアドレスの辞書
+        Mapping[str, str]: PLCデバイスアドレスの読み取り専用辞書
             - TIME_DEVICE: タイムスタンプ格納デバイス
             - PRODUCTION_TYPE_DEVICE: 機種番号格納デバイス
             - PLAN_DEVICE: 計画数格納デバイス
@@ -299,23 +629,15 @@ def get_plc_device_dict() -> dict[str, str]:
             - IN_OPERATING_DEVICE: 稼働中フラグ格納デバイス
 
     Note:
-        モジュールレベルでキャッシュされたPLCDeviceListを使用。
-        パフォーマンス最適化のため、繰り返し呼び出しても初期化は1回のみ。
+        モジュールロード時に1回だけ構築した同一オブジェクトを返す。
+        変更不可 (MappingProxyType) のため、呼び出し側で書き換えないこと。
 
     Examples:
         >>> devices = get_plc_device_dict()
         >>> print(devices["TIME_DEVICE"])  # "SD210"
         >>> print(devices["PLAN_DEVICE"])  # "D300"
     """
-    return {
-        "TIME_DEVICE": _plc_device_list.TIME_DEVICE,
-        "PRODUCTION_TYPE_DEVICE": _plc_device_list.PRODUCTION_TYPE_DEVICE,
-        "PLAN_DEVICE": _plc_device_list.PLAN_DEVICE,
-        "ACTUAL_DEVICE": _plc_device_list.ACTUAL_DEVICE,
-        "ALARM_FLAG_DEVICE": _plc_device_list.ALARM_FLAG_DEVICE,
-        "ALARM_MSG_DEVICE": _plc_device_list.ALARM_MSG_DEVICE,
-        "IN_OPERATING_DEVICE": _plc_device_list.IN_OPERATING_DEVICE,
-    }
+    return _PLC_DEVICE_DICT
 
 
 def default_error_data() -> ProductionData:
@@ -324,8 +646,6 @@ def default_error_data() -> ProductionData:
     Returns:
         ProductionData: エラーデフォルトの生産データ
     """
-    from backend.config_helpers import get_line_name
-
     try:
         line_name = get_line_name()
     except Exception:
@@ -342,17 +662,30 @@ def default_error_data() -> ProductionData:
         remain_pallet=0,
         fully=1,
         alarm=True,
-        alarm_msg="PLC通信エラー",
+        alarm_msg=ERROR_ALARM_MSG,
         timestamp=datetime.now(),
     )
 
 
+def is_error_data(data: ProductionData) -> bool:
+    """default_error_dataで生成した取得失敗時のデータか判定する
+
+    Args:
+        data: 判定する生産データ
+
+    Returns:
+        bool: 取得失敗時のデータならTrue
+    """
+    return data.alarm and data.alarm_msg == ERROR_ALARM_MSG
+
+
 def fetch_production_data(client: PLCClient) -> ProductionData:
     """PLCから生産データを一括取得
 
     各種デバイスアドレスから生産情報を取得し、
     計算ロジック(残りパレット数・残り時間)を適用して
     ProductionDataオブジェクトを構築する。
+    近接するデバイスはブロック単位でまとめて読み取る (device_batch参照)。
 
     Args:
         client: PLCクライアント (接続済み)
@@ -379,47 +712,90 @@ def fetch_production_data(client: PLCClient) -> ProductionData:
         >>> print(data.line_name)  # "LINE_1"
         >>> print(data.actual)     # 30000
     """
-    from backend.calculators import calculate_remain_minutes, calculate_remain_pallet
-    from backend.config_helpers import get_config_data, get_line_name
-
     # 長時間稼働時のコネクション切断対策: 読み込み前にヘルスチェック
     if not client.ensure_connected():
         logger.error("PLC connection check failed, returning error data")
         return default_error_data()
 
-    device_dict = get_plc_device_dict()
-    line_name = get_line_name()
-    production_type = fetch_production_type(
-        client, device_dict["PRODUCTION_TYPE_DEVICE"]
-    )
+    # 近接するデバイスをまとめて読み取り、通信往復回数を減らす
+    raw = _read_batched(client, _WORD_READ_BLOCKS, _BIT_READ_BLOCKS)
+    return _build_production_data(client, raw)
 
-    # production_typeの範囲チェック (0-15に制限)
-    if production_type < 0 or production_type > 15:
-        logger.warning(
-            f"Invalid production_type {production_type} from PLC, defaulting to 0"
-        )
-        production_type = 0
 
-    plan = fetch_plan(client, device_dict["PLAN_DEVICE"])
-    actual = fetch_actual(client, device_dict["ACTUAL_DEVICE"])
-    in_operating = fetch_in_operating(client, device_dict["IN_OPERATING_DEVICE"])
-    alarm = fetch_alarm_flag(client, device_dict["ALARM_FLAG_DEVICE"])
-    alarm_msg = fetch_alarm_msg(client, device_dict["ALARM_MSG_DEVICE"])
+def _build_production_data(
+    client: PLCClient, raw: dict[str, list[int]]
+) -> ProductionData:
+    """一括読み取り結果からProductionDataを構築する
+
+    一括読み取りに失敗した項目は従来どおり個別に読み取る。
+
+    Args:
+        client: PLCクライアント (個別読み取りのフォールバック用)
+        raw: _read_batchedの結果
+
+    Returns:
+        ProductionData: 統合された生産データ
+    """
+    line_name = get_line_name()
+
+    words = raw.get("production_type")
+    if words is not None:
+        production_type = _validate_production_type(words[0])
+    else:
+        production_type = fetch_production_type(client, _PRODUCTION_TYPE_DEVICE)
+    # 範囲チェック (0-15) は_validate_production_type・fetch_production_typeで済んでいる
+
+    words = raw.get("plan")
+    if words is not None:
+        plan = max(0, _decode_dword(words))
+    else:
+        plan = fetch_plan(client, _PLAN_DEVICE)
+
+    words = raw.get("actual")
+    if words is not None:
+        actual = max(0, _decode_dword(words))
+    else:
+        actual = fetch_actual(client, _ACTUAL_DEVICE)
+
+    bits = raw.get("in_operating")
+    if bits is not None:
+        in_operating = bool(bits[0])
+    else:
+        in_operating = fetch_in_operating(client, _IN_OPERATING_DEVICE)
+
+    bits = raw.get("alarm")
+    if bits is not None:
+        alarm = bool(bits[0])
+    else:
+        alarm = fetch_alarm_flag(client, _ALARM_FLAG_DEVICE)
+
+    words = raw.get("alarm_msg")
+    if words is not None:
+        alarm_msg = _decode_alarm_msg(words)
+    else:
+        alarm_msg = fetch_alarm_msg(client, _ALARM_MSG_DEVICE)
 
     # 機種設定を取得してproduction_nameを解決
-    try:
-        config = get_config_data(production_type)
-    except ValueError as e:
+    config = find_config_data(production_type)
+    if config is None:
         # 機種設定が見つからない場合はデフォルト値を使用
-        logger.warning(f"Config not found for production_type {production_type}: {e}")
+        logger.warning(f"Config not found for production_type {production_type}")
         return default_error_data()
 
     # 機種設定を使って計算
-    _remain_min = calculate_remain_minutes(plan, actual, production_type)
+    # 取得済みの設定を渡し、計算ごとの機種設定の再取得を省く
+    _remain_min = calculate_remain_minutes(plan, actual, production_type, config=config)
     remain_min = math.ceil(_remain_min)
-    remain_pallet = calculate_remain_pallet(plan, actual, production_type)
+    remain_pallet = calculate_remain_pallet(
+        plan, actual, production_type, config=config
+    )
     fully = config.fully
-    timestamp = fetch_production_timestamp(client, device_dict["TIME_DEVICE"])
+
+    words = raw.get("timestamp")
+    if words is not None:
+        timestamp = _decode_timestamp(words)
+    else:
+        timestamp = fetch_production_timestamp(client, _TIME_DEVICE)
 
     try:
         fetch_data = ProductionData(
@@ -1,13 +1,44 @@
+import ctypes
+import ctypes.util
 import os
 import platform
 import subprocess
+import sys
 from datetime import datetime
+from functools import lru_cache
 from backend.logging import backend_logger as logger
 
+# clock_settime用のクロックID (Linux/macOS共通)
+CLOCK_REALTIME = 0
 
+
+class _Timespec(ctypes.Structure):
+    """struct timespec (clock_settime引数)"""
+
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _SystemTime(ctypes.Structure):
+    """SYSTEMTIME構造体 (Windows SetLocalTime引数)"""
+
+    _fields_ = [
+        ("wYear", ctypes.c_ushort),
+        ("wMonth", ctypes.c_ushort),
+        ("wDayOfWeek", ctypes.c_ushort),
+        ("wDay", ctypes.c_ushort),
+        ("wHour", ctypes.c_ushort),
+        ("wMinute", ctypes.c_ushort),
+        ("wSecond", ctypes.c_ushort),
+        ("wMilliseconds", ctypes.c_ushort),
+    ]
+
+
+@lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     """Raspberry Pi上で動作しているかを判定する
 
+    実行環境はプロセス中に変わらないため、判定結果はキャッシュされる。
+
     Returns:
         bool: Raspberry Pi上であればTrue、そうでなければFalse
     """
@@ -19,6 +50,7 @@ def is_raspberry_pi() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def is_windows() -> bool:
     """Windows上で動作しているかを判定する
 
@@ -28,6 +60,7 @@ def is_windows() -> bool:
     return os.name == "nt"
 
 
+@lru_cache(maxsize=1)
 def is_linux() -> bool:
     """Linux上で動作しているかを判定する
 
@@ -37,6 +70,7 @@ def is_linux() -> bool:
     return os.name == "posix" and not is_raspberry_pi()
 
 
+@lru_cache(maxsize=1)
 def is_mac() -> bool:
     """macOS上で動作しているかを判定する
 
@@ -50,8 +84,10 @@ def set_system_clock(target_time: datetime) -> bool:
     """システム時計を設定する
 
     Note:
-        - Windows: 管理者権限が必要
-        - Linux: sudoersでNOPASSWD設定が必要 (Raspberry Pi推奨)
+        - Windows: 管理者権限が必要 (SetLocalTime)
+        - Linux: CAP_SYS_TIMEがあればclock_settimeを直接呼び出す。
+          権限がない場合はsudo dateにフォールバックするため、
+          sudoersでNOPASSWD設定が必要 (Raspberry Pi推奨)
         - 本番環境では慎重に使用すること
 
     Args:
@@ -66,26 +102,14 @@ def set_system_clock(target_time: datetime) -> bool:
     """
     try:
         if is_windows():  # Windows
-            subprocess.run(
-                ["date", target_time.strftime("%Y-%m-%d")],
-                check=True,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["time", target_time.strftime("%H:%M:%S")],
-                check=True,
-                capture_output=True,
-            )
+            _set_local_time_windows(target_time)
         else:  # Unix/Linux (Raspberry Pi)
-            # フォーマット: MMDDhhmmYYYY.SS
-            time_str = target_time.strftime("%m%d%H%M%Y.%S")
-            # sudoersでNOPASSWD設定が必要: pi ALL=(ALL) NOPASSWD: /bin/date
-            subprocess.run(
-                ["sudo", "date", time_str],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            try:
+                _clock_settime(target_time)
+            except PermissionError:
+                # CAP_SYS_TIMEがない場合はsudo経由のdateコマンドにフォールバック
+                logger.debug("clock_settime not permitted, falling back to sudo date")
+                _set_clock_with_date_command(target_time)
 
         logger.info(f"System clock set to {target_time.strftime('%Y-%m-%d %H:%M:%S')}")
         return True
@@ -101,6 +125,84 @@ def set_system_clock(target_time: datetime) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _load_libc() -> ctypes.CDLL:
+    """C標準ライブラリをロードする (プロセス中1回のみ)
+
+    Returns:
+        ctypes.CDLL: libcハンドル (errno取得有効)
+    """
+    return ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+
+def _clock_settime(target_time: datetime) -> None:
+    """clock_settime(CLOCK_REALTIME)でシステム時計を直接設定する
+
+    Args:
+        target_time: 設定する日時 (naiveな場合はローカル時刻として扱う)
+
+    Raises:
+        PermissionError: CAP_SYS_TIMEがない場合 (EPERM)
+        OSError: その他のシステムコール失敗
+    """
+    spec = _Timespec(
+        int(target_time.replace(microsecond=0).timestamp()),
+        target_time.microsecond * 1000,
+    )
+    if _load_libc().clock_settime(CLOCK_REALTIME, ctypes.byref(spec)) != 0:
+        err = ctypes.get_errno()
+        # OSErrorはerrnoに応じてPermissionError等のサブクラスを生成する
+        raise OSError(err, os.strerror(err))
+
+
+def _set_clock_with_date_command(target_time: datetime) -> None:
+    """sudo dateコマンドでシステム時計を設定する
+
+    Args:
+        target_time: 設定する日時
+
+    Raises:
+        subprocess.CalledProcessError: コマンドが失敗した場合
+    """
+    # フォーマット: MMDDhhmmYYYY.SS
+    time_str = target_time.strftime("%m%d%H%M%Y.%S")
+    # sudoersでNOPASSWD設定が必要: pi ALL=(ALL) NOPASSWD: /bin/date
+    subprocess.run(
+        ["sudo", "date", time_str],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _set_local_time_windows(target_time: datetime) -> None:
+    """Win32 SetLocalTimeでシステム時計を設定する
+
+    Args:
+        target_time: 設定する日時 (ローカル時刻)
+
+    Raises:
+        OSError: SetLocalTimeが失敗した場合 (管理者権限不足等)
+    """
+    # ctypes.WinDLLはWindowsのみ存在する
+    if sys.platform != "win32":
+        raise OSError("SetLocalTime is only available on Windows")
+    # GetLastErrorは他のAPI呼び出しで上書きされ得るため、ctypesに退避させる
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    system_time = _SystemTime(
+        target_time.year,
+        target_time.month,
+        target_time.isoweekday() % 7,  # 0=日曜
+        target_time.day,
+        target_time.hour,
+        target_time.minute,
+        target_time.second,
+        target_time.microsecond // 1000,
+    )
+    if not kernel32.SetLocalTime(ctypes.byref(system_time)):
+        raise OSError(f"SetLocalTime failed (error code {ctypes.get_last_error()})")
+
+
 def restart_system() -> bool:
     """システムを再起動する
 
@@ -1,4 +1,10 @@
-from .settings import LogLevel, Settings, Theme
+from .settings import LogLevel, Settings, Theme, get_settings
 from .production_config import ProductionConfigManager
 
-__all__ = ["LogLevel", "Settings", "Theme", "ProductionConfigManager"]
+__all__ = [
+    "LogLevel",
+    "Settings",
+    "Theme",
+    "get_settings",
+    "ProductionConfigManager",
+]
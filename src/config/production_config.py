@@ -6,11 +6,26 @@
 - シングルトンパターンによる一元管理
 """
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 import json
 from schemas.production_type import ProductionTypeConfig
 
+# JSONパーサ (orjsonがインストールされていれば使用し、起動時の読み込みを高速化)
+# orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラスのため例外処理は共通
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 機種番号の数 (PLCの機種番号は4ビット: 0-15)
+PRODUCTION_TYPE_COUNT = 16
+PRODUCTION_TYPE_MASK = PRODUCTION_TYPE_COUNT - 1
+
 
 class ProductionConfigManager:
     """機種マスタ管理クラス (シングルトン)
@@ -18,14 +33,23 @@ class ProductionConfigManager:
     環境変数LINE_NAMEに対応するJSONファイルから機種マスタを読み込み、
     アプリケーション全体で一元管理する。
 
+    LINE_NAMEは初回生成時に1回だけ読み込まれる。実行中にLINE_NAMEを
+    切り替える場合は ProductionConfigManager._instance = None で破棄してから
+    再生成すること。
+
     使用例:
         >>> manager = ProductionConfigManager()
         >>> config = manager.get_config(1)
         >>> print(config.name)  # "機種A"
     """
 
+    # インスタンス属性を固定し、__dict__を持たせない
+    __slots__ = ("_configs", "_configs_by_type", "_line_name")
+
     _instance: ClassVar["ProductionConfigManager | None"] = None
     _configs: dict[int, ProductionTypeConfig]
+    # 機種番号(0-15)で直接引ける設定表 (未定義の機種はNone)
+    _configs_by_type: tuple[ProductionTypeConfig | None, ...]
     _line_name: str
 
     def __new__(cls, line_name: str | None = None) -> "ProductionConfigManager":
@@ -47,9 +71,33 @@ class ProductionConfigManager:
                 line_name = Settings().LINE_NAME
             instance._line_name = line_name
             instance._configs = instance._load_configs()
+            instance._configs_by_type = tuple(
+                instance._configs.get(i) for i in range(PRODUCTION_TYPE_COUNT)
+            )
             cls._instance = instance
         return cls._instance
 
+    @classmethod
+    def initialize(cls, line_name: str) -> "ProductionConfigManager":
+        """ライン名を明示して機種マスタを読み込む (起動時用)
+
+        Args:
+            line_name: ライン名
+
+        Returns:
+            ProductionConfigManager: シングルトンインスタンス
+
+        Raises:
+            RuntimeError: 別のライン名で既に初期化されている場合
+        """
+        instance = cls(line_name)
+        if instance._line_name != line_name:
+            raise RuntimeError(
+                f"ProductionConfigManager is already initialized "
+                f"with LINE_NAME={instance._line_name}"
+            )
+        return instance
+
     def _load_configs(self) -> dict[int, ProductionTypeConfig]:
         """JSONファイルから機種マスタを読み込み
 
@@ -65,15 +113,17 @@ class ProductionConfigManager:
         config_dir = project_root / "config" / "production_types"
         config_file = config_dir / f"{self._line_name}.json"
 
-        if not config_file.exists():
+        # exists()で事前確認せず、読み込みの失敗で判定する (stat呼び出しを省略)
+        try:
+            raw = config_file.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Production type config not found: {config_file}\n"
                 f"Please create config/production_types/{self._line_name}.json"
-            )
+            ) from None
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(raw)
 
             # Pydanticで検証しながら辞書を構築
             return {int(k): ProductionTypeConfig(**v) for k, v in data.items()}
@@ -95,18 +145,35 @@ class ProductionConfigManager:
         Raises:
             ValueError: 機種番号が範囲外または未定義の場合
         """
-        if production_type < 0 or production_type > 15:
+        if production_type & ~PRODUCTION_TYPE_MASK:
             raise ValueError(
                 f"production_type must be between 0 and 15, got {production_type}"
             )
 
-        if production_type not in self._configs:
+        config = self._configs_by_type[production_type]
+        if config is None:
             raise ValueError(
                 f"production_type {production_type} is not configured "
                 f"in LINE_NAME={self._line_name}"
             )
 
-        return self._configs[production_type]
+        return config
+
+    def find_config(self, production_type: int) -> ProductionTypeConfig | None:
+        """機種番号から設定を取得 (例外を送出しない版)
+
+        毎ポーリングで呼ばれる経路向け。範囲外・未定義の判定を
+        ビットマスクと表引きのみで行う。
+
+        Args:
+            production_type: 機種番号 (0-15)
+
+        Returns:
+            ProductionTypeConfig | None: 機種設定 (範囲外または未定義の場合はNone)
+        """
+        if production_type & ~PRODUCTION_TYPE_MASK:
+            return None
+        return self._configs_by_type[production_type]
 
     def get_all_configs(self) -> dict[int, ProductionTypeConfig]:
         """全機種設定を取得
@@ -1,10 +1,102 @@
 import os
 from enum import Enum
+from functools import cache
+from dotenv import dotenv_values
 from pydantic import IPvAnyAddress, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 from typing import Any
 
 
+@cache
+def _env_file_exists() -> bool:
+    """カレントディレクトリに.envファイルが存在するか (プロセス内で1回だけ確認)
+
+    Settings/PLCDeviceList/WatchdogSettingsの生成ごとにstatを発行しないよう、
+    結果をキャッシュする。
+
+    Returns:
+        bool: .envファイルが存在すればTrue
+    """
+    return os.path.exists(".env")
+
+
+@cache
+def _read_env_file(path: str, encoding: str) -> dict[str, str]:
+    """.envファイルを読み込む (プロセス内で1回だけ解析)
+
+    Settings/PLCDeviceListは同じ.envを参照するため、解析結果を共有する。
+
+    Args:
+        path: .envファイルのパス
+        encoding: ファイルの文字コード
+
+    Returns:
+        dict[str, str]: 変数名(小文字) → 値 (値のない行は除外)
+    """
+    return {
+        key.lower(): value
+        for key, value in dotenv_values(path, encoding=encoding).items()
+        if value is not None
+    }
+
+
+class _CachedDotEnvSettingsSource(PydanticBaseSettingsSource):
+    """解析済みの.envから値を取り出す設定ソース
+
+    pydantic-settings標準のDotEnvSettingsSourceはクラスの生成ごとに
+    .envを読み直すため、_read_env_fileのキャッシュを使う版に置き換える。
+    フィールド名は標準と同様に大文字小文字を区別しない。
+    """
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        """1フィールド分の値を取得する (PydanticBaseSettingsSourceの抽象メソッド)"""
+        values = self._env_values()
+        return values.get(field_name.lower()), field_name, False
+
+    def _env_values(self) -> dict[str, str]:
+        """対象クラスのenv_file設定に従って.envの内容を取得する"""
+        env_file = self.config.get("env_file") or ".env"
+        encoding = self.config.get("env_file_encoding") or "utf-8"
+        return _read_env_file(str(env_file), encoding)
+
+    def __call__(self) -> dict[str, Any]:
+        """対象クラスのフィールドに該当する.envの値を返す"""
+        values = self._env_values()
+        return {
+            name: values[name.lower()]
+            for name in self.settings_cls.model_fields
+            if name.lower() in values
+        }
+
+
+class _EnvFileSettings(BaseSettings):
+    """.envの解析結果を共有する設定クラスの基底"""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        # 優先順位は標準と同じ (引数 > 環境変数 > .env > secrets)
+        return (
+            init_settings,
+            env_settings,
+            _CachedDotEnvSettingsSource(settings_cls),
+            file_secret_settings,
+        )
+
+
 class Theme(str, Enum):
     """UIテーマ
 
@@ -33,7 +125,7 @@ class LogLevel(str, Enum):
     ERROR = "ERROR"
 
 
-class Settings(BaseSettings):
+class Settings(_EnvFileSettings):
     """アプリケーション設定 (Pydantic Settings)
 
     .envファイルから環境変数を読み込み、型安全な設定管理を提供する。
@@ -115,7 +207,7 @@ class Settings(BaseSettings):
                 kwargs.setdefault("LOG_LEVEL", LogLevel.DEBUG)
 
         # .envファイルの存在チェック
-        if not os.path.exists(".env") and not kwargs:
+        if not kwargs and not _env_file_exists():
             raise FileNotFoundError(
                 "\n❌ .env file not found.\n"
                 "Please copy .env.example to .env and configure it:\n"
@@ -126,7 +218,7 @@ class Settings(BaseSettings):
         super().__init__(**kwargs)
 
 
-class PLCDeviceList(BaseSettings):
+class PLCDeviceList(_EnvFileSettings):
     """PLCデバイスアドレス設定 (Pydantic Settings)
 
     各データ項目のPLCデバイスアドレスを管理する。
@@ -158,7 +250,7 @@ class PLCDeviceList(BaseSettings):
 
     def __init__(self: Any, **kwargs: Any) -> None:
         # .envファイルの存在チェック
-        if not os.path.exists(".env") and not kwargs:
+        if not kwargs and not _env_file_exists():
             raise FileNotFoundError(
                 "\n❌ .env file not found.\n"
                 "Please copy .env.example to .env and configure it:\n"
@@ -168,7 +260,7 @@ class PLCDeviceList(BaseSettings):
         super().__init__(**kwargs)
 
 
-class WatchdogSettings(BaseSettings):
+class WatchdogSettings(_EnvFileSettings):
     """Watchdog専用設定 (軽量)
 
     Watchdogプロセスが必要とする最小限の設定のみを読み込む。
@@ -207,7 +299,7 @@ class WatchdogSettings(BaseSettings):
     )
 
     def __init__(self: Any, **kwargs: Any) -> None:
-        if not os.path.exists(".env") and not kwargs:
+        if not kwargs and not _env_file_exists():
             raise FileNotFoundError(
                 "\n❌ .env file not found.\n"
                 "Please copy .env.example to .env and configure it:\n"
@@ -215,3 +307,26 @@ class WatchdogSettings(BaseSettings):
                 "  Copy-Item .env.example .env  (Windows)\n"
             )
         super().__init__(**kwargs)
+
+
+@cache
+def get_settings() -> Settings:
+    """アプリケーション設定を取得 (プロセス内で1回だけ読み込む)
+
+    .envの読み込みとPydanticの検証は初回呼び出し時のみ行い、
+    以降は同じインスタンスを返す。
+
+    Returns:
+        Settings: アプリケーション設定
+    """
+    return Settings()
+
+
+@cache
+def get_plc_devices() -> PLCDeviceList:
+    """PLCデバイスアドレス設定を取得 (プロセス内で1回だけ読み込む)
+
+    Returns:
+        PLCDeviceList: PLCデバイスアドレス設定
+    """
+    return PLCDeviceList()
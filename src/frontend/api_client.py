@@ -8,28 +8,49 @@ Streamlitフロントエンドから使用する。
 - エラー時は前回取得値を返す
 """
 
+import atexit
+import threading
 import httpx
-from datetime import datetime
 from typing import Any
 
-from config.settings import Settings
+from config.settings import get_settings
 from schemas import ProductionData
 from backend.logging import app_logger as logger
 
 # 設定読み込み
-_settings = Settings()
+_settings = get_settings()
 API_BASE_URL = f"http://{_settings.API_HOST}:{_settings.API_PORT}"
 
 # タイムアウト設定 (設定ファイルから読み込み)
 API_TIMEOUT = _settings.FRONTEND_API_TIMEOUT
 
+# APIエンドポイントのパス
+PATH_PRODUCTION = "/api/production"
+PATH_HEALTH = "/health"
+PATH_STATUS = "/api/status"
+PATH_SYNC_TIME = "/api/system/sync-time"
+PATH_SHUTDOWN = "/api/shutdown"
+PATH_RESTART = "/api/restart"
+
 # 前回取得値のキャッシュ (フェイルセーフ用)
 _last_production_data: ProductionData | None = None
 
 
+# HTTPクライアント (リフレッシュごとに生成せず、キープアライブ接続を使い回す)
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
 def _get_client() -> httpx.Client:
-    """HTTPクライアントを取得"""
-    return httpx.Client(base_url=API_BASE_URL, timeout=API_TIMEOUT)
+    """HTTPクライアントを取得 (初回呼び出し時に生成し、以降は使い回す)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(base_url=API_BASE_URL, timeout=API_TIMEOUT)
+                # プロセス終了時に接続を閉じる
+                atexit.register(_client.close)
+    return _client
 
 
 def fetch_production_from_api() -> ProductionData:
@@ -46,29 +67,16 @@ def fetch_production_from_api() -> ProductionData:
     global _last_production_data
 
     try:
-        with _get_client() as client:
-            response = client.get("/api/production")
-            response.raise_for_status()
-            data = response.json()
-
-            result = ProductionData(
-                line_name=data["line_name"],
-                production_type=data["production_type"],
-                production_name=data["production_name"],
-                plan=data["plan"],
-                actual=data["actual"],
-                in_operating=data["in_operating"],
-                remain_min=data["remain_min"],
-                remain_pallet=data["remain_pallet"],
-                fully=data["fully"],
-                alarm=data["alarm"],
-                alarm_msg=data["alarm_msg"],
-                timestamp=datetime.fromisoformat(data["timestamp"]),
-            )
-
-            # 成功時は前回値を更新
-            _last_production_data = result
-            return result
+        client = _get_client()
+        response = client.get(PATH_PRODUCTION)
+        response.raise_for_status()
+
+        # JSONの解析と検証をpydantic-coreで1回で行う (中間のdictを作らない)
+        result = ProductionData.model_validate_json(response.content)
+
+        # 成功時は前回値を更新
+        _last_production_data = result
+        return result
 
     except httpx.TimeoutException as e:
         logger.warning(f"API request timeout ({API_TIMEOUT}s): {e}")
@@ -102,20 +110,12 @@ def _get_fallback_data(error_msg: str) -> ProductionData:
         logger.info(
             f"Using cached data from {_last_production_data.timestamp.isoformat()}"
         )
-        # 前回値のコピーを作成 (alarm_msgを更新)
-        fallback = ProductionData(
-            line_name=_last_production_data.line_name,
-            production_type=_last_production_data.production_type,
-            production_name=_last_production_data.production_name,
-            plan=_last_production_data.plan,
-            actual=_last_production_data.actual,
-            in_operating=_last_production_data.in_operating,
-            remain_min=_last_production_data.remain_min,
-            remain_pallet=_last_production_data.remain_pallet,
-            fully=_last_production_data.fully,
-            alarm=False,  # キャッシュ使用中はアラーム表示しない
-            alarm_msg=f"[キャッシュ] {error_msg}",
-            timestamp=_last_production_data.timestamp,
+        # 前回値のコピーを作成 (変更する項目以外は検証済みのため再検証しない)
+        fallback = _last_production_data.model_copy(
+            update={
+                "alarm": False,  # キャッシュ使用中はアラーム表示しない
+                "alarm_msg": f"[キャッシュ] {error_msg}",
+            }
         )
         return fallback
     else:
@@ -133,9 +133,10 @@ def check_api_health() -> bool:
         bool: APIが正常ならTrue
     """
     try:
-        with _get_client() as client:
-            response = client.get("/health")
-            return response.status_code == 200
+        client = _get_client()
+        # 応答本文は不要なため、HEADでステータスのみ確認する
+        response = client.head(PATH_HEALTH)
+        return response.is_success
     except httpx.RequestError:
         return False
 
@@ -147,10 +148,10 @@ def get_api_status() -> dict[str, Any]:
         dict: ステータス情報
     """
     try:
-        with _get_client() as client:
-            response = client.get("/api/status")
-            response.raise_for_status()
-            return response.json()
+        client = _get_client()
+        response = client.get(PATH_STATUS)
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Failed to get API status: {e}")
         return {
@@ -168,10 +169,10 @@ def request_time_sync() -> dict[str, Any]:
         dict: 同期結果
     """
     try:
-        with _get_client() as client:
-            response = client.post("/api/system/sync-time")
-            response.raise_for_status()
-            return response.json()
+        client = _get_client()
+        response = client.post(PATH_SYNC_TIME)
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Time sync request failed: {e}")
         return {
@@ -188,10 +189,10 @@ def request_shutdown() -> dict[str, Any]:
         dict: シャットダウン結果
     """
     try:
-        with _get_client() as client:
-            response = client.post("/api/shutdown")
-            response.raise_for_status()
-            return response.json()
+        client = _get_client()
+        response = client.post(PATH_SHUTDOWN)
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Shutdown request failed: {e}")
         return {
@@ -209,15 +210,15 @@ def request_restart() -> dict[str, Any]:
         dict: 再起動結果
     """
     try:
-        with _get_client() as client:
-            response = client.post("/api/restart")
-            if response.status_code == 403:
-                return {
-                    "status": "forbidden",
-                    "message": "再起動は許可されていません",
-                }
-            response.raise_for_status()
-            return response.json()
+        client = _get_client()
+        response = client.post(PATH_RESTART)
+        if response.status_code == 403:
+            return {
+                "status": "forbidden",
+                "message": "再起動は許可されていません",
+            }
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         logger.error(f"Restart request failed: {e}")
         return {
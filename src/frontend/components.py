@@ -4,11 +4,16 @@
 テーマ対応により、ライトモード/ダークモードの切り替えが可能。
 """
 
+from functools import lru_cache
+
 import plotly.graph_objects as go
 import streamlit as st
 from schemas import ProductionData
 from frontend.styles import get_theme_colors
 
+# ゲージ図のキャッシュ件数 (進捗率0.1%刻み × テーマ × 異常有無の組み合わせ)
+GAUGE_CACHE_SIZE = 256
+
 
 def get_status_info(
     alarm: bool, progress: float, in_operating: bool
@@ -58,10 +63,30 @@ def get_gauge_figure(
     Returns:
         go.Figure: Plotlyゲージ図オブジェクト
 
+    Note:
+        進捗率は0.1%単位に丸め、同じ組み合わせでは生成済みの図を共有する。
+        リフレッシュごとのFigure生成(Plotlyの検証処理)を省くため。
+        返された図は呼び出し側で変更しないこと。
+
     Examples:
         >>> fig = get_gauge_figure(0.75, theme="dark")
         >>> fig.show()  # Streamlitで表示
     """
+    return _build_gauge_figure(round(progress * 1000), theme, alarm)
+
+
+@lru_cache(maxsize=GAUGE_CACHE_SIZE)
+def _build_gauge_figure(progress_permille: int, theme: str, alarm: bool) -> go.Figure:
+    """ゲージ図を生成する (get_gauge_figureのキャッシュ本体)
+
+    Args:
+        progress_permille: 進捗率 (0.1%単位の整数, 1000 = 100%)
+        theme: "dark" または "light"
+        alarm: 異常フラグ
+
+    Returns:
+        go.Figure: Plotlyゲージ図オブジェクト
+    """
     colors = get_theme_colors(theme)
 
     # 異常時はstatus_alarm_bg、通常時は緑
@@ -70,7 +95,7 @@ def get_gauge_figure(
     fig = go.Figure(
         go.Indicator(
             mode="gauge+number",
-            value=progress * 100,
+            value=progress_permille / 10,
             number={"suffix": "%"},  # パーセント記号を追加
             # title={"text": "生産進捗率"},
             gauge={
@@ -90,10 +115,12 @@ def get_gauge_figure(
     )
 
     fig.update_layout(
-        margin=dict(t=30, b=5, l=30, r=30),
+        margin={"t": 30, "b": 5, "l": 30, "r": 30},
         height=350,  # 1920x1080対応：ゲージの高さ
         paper_bgcolor=colors["gauge_bg"],
-        font=dict(color=colors["text_color"]),
+        font={"color": colors["text_color"]},
+        # 値更新時のアニメーションを無効化 (表示端末のブラウザ負荷軽減)
+        transition={"duration": 0},
     )
 
     return fig
@@ -112,23 +139,20 @@ def render_header(data: ProductionData) -> None:
         Streamlitのst.markdown()でHTMLを直接レンダリング。
         CSSはget_page_styles()で定義されたスタイルを参照。
     """
-    col_head_l, col_head_r = st.columns([3, 1])
-    with col_head_l:
-        st.markdown(
-            f"<div class='header-title'>{data.line_name} 生産進捗 - {data.production_name}</div>",
-            unsafe_allow_html=True,
-        )
-    with col_head_r:
-        st.markdown(
-            f"<div class='header-time'>{data.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</div>",
-            unsafe_allow_html=True,
-        )
+    # st.columnsは列ごとにコンテナ要素を生成するため、flexで横並びにして1回で描画する
+    st.markdown(
+        "<div style='display: flex; gap: 1rem; align-items: center;'>"
+        f"<div class='header-title' style='flex: 3;'>{data.line_name} 生産進捗 - {data.production_name}</div>"
+        f"<div class='header-time' style='flex: 1;'>{data.timestamp:%Y-%m-%d %H:%M:%S}</div>"
+        "</div>",
+        unsafe_allow_html=True,
+    )
 
 
-def render_production_metrics(
-    data: ProductionData, progress: float, alarm: bool = False, theme: str = "dark"
-) -> None:
-    """生産数量メトリクスをレンダリング
+def _production_metrics_html(
+    data: ProductionData, progress: float, alarm: bool, theme: str
+) -> str:
+    """生産数量メトリクスのHTMLを生成する
 
     計画数・実績数・進捗バー・残りパレット数を表示する。
     各KPIは大きな数値とラベルで視認性を高める。
@@ -139,48 +163,36 @@ def render_production_metrics(
         alarm: 異常フラグ (Trueの場合、進捗バーが赤くなる)
         theme: "dark" または "light"
 
+    Returns:
+        str: HTML文字列
+
     Note:
         パレット情報 = 残りパレット数 / 必要総パレット数
         必要総パレット数 = plan / fully (1パレットあたりの積載数)
     """
     colors = get_theme_colors(theme)
 
-    st.markdown(
-        f"<div class='kpi-value-big' style='text-align: center;'>{data.actual:,d} <span style='font-size: 0.6em; color: #888;'>/ {data.plan:,d}</span></div>",
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        "<div class='kpi-label' style='text-align: center; margin-top: -10px;'>投入数 / 生産数量</div>",
-        unsafe_allow_html=True,
-    )
-
     # 異常時はstatus_alarm_bg、通常時は緑のプログレスバー
     bar_color = colors["status_alarm_bg"] if alarm else colors["gauge_bar"]
     percent = min(progress * 100, 100)
-    st.markdown(
-        f"""
-        <div style="background-color: #333; border-radius: 5px; height: 20px; margin: 10px 0;">
-            <div style="background-color: {bar_color}; width: {percent}%; height: 100%; border-radius: 5px; transition: width 0.3s ease;"></div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
 
     # パレット情報（最重要）
     # ゼロ除算防止: fully=0の場合は0を返す
     required_pallets = data.plan / data.fully if data.fully > 0 else 0
-    st.markdown(
-        f"<div class='kpi-value-big' style='text-align: center; margin-top: 1rem;'>{data.remain_pallet:.1f} <span style='font-size: 0.6em; color: #888;'>/ {required_pallets:.1f}</span></div>",
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        "<div class='kpi-label' style='text-align: center; margin-top: -10px;'>残PL / 総PL</div>",
-        unsafe_allow_html=True,
+
+    return (
+        f"<div class='kpi-value-big' style='text-align: center;'>{data.actual:,d} <span style='font-size: 0.6em; color: #888;'>/ {data.plan:,d}</span></div>"
+        "<div class='kpi-label' style='text-align: center;'>投入数 / 生産数量</div>"
+        "<div style='background-color: #333; border-radius: 5px; height: 20px; margin: 10px 0;'>"
+        f"<div style='background-color: {bar_color}; width: {percent}%; height: 100%; border-radius: 5px; transition: width 0.3s ease;'></div>"
+        "</div>"
+        f"<div class='kpi-value-big' style='text-align: center; margin-top: 1rem;'>{data.remain_pallet:.1f} <span style='font-size: 0.6em; color: #888;'>/ {required_pallets:.1f}</span></div>"
+        "<div class='kpi-label' style='text-align: center;'>残PL / 総PL</div>"
     )
 
 
-def render_time_and_status(data: ProductionData, progress: float) -> None:
-    """残り時間とステータスをレンダリング
+def _time_and_status_html(data: ProductionData, progress: float) -> str:
+    """残り時間とステータスのHTMLを生成する
 
     残り生産時間(HH時間MM分形式)と稼働ステータス(稼働中/要注意/異常)を表示。
     ステータス色はget_status_info()で判定され、CSS classで制御。
@@ -189,6 +201,9 @@ def render_time_and_status(data: ProductionData, progress: float) -> None:
         data: 生産データ (remain_min, in_operating, alarmを使用)
         progress: 進捗率 (0.0-1.0, ステータス判定に使用)
 
+    Returns:
+        str: HTML文字列
+
     Note:
         ステータス判定:
         - alarm=True → 異常 (赤)
@@ -196,20 +211,34 @@ def render_time_and_status(data: ProductionData, progress: float) -> None:
         - progress>=0.8 → 要注意 (黄)
         - progress<0.8 → 稼働中 (緑)
     """
-    hours = data.remain_min // 60
-    mins = data.remain_min % 60
-    st.markdown(
-        f"<div class='kpi-value-big' style='text-align: center;'>{hours:02d}<span style='font-size: 0.6em; color: #888;'>時間</span>{mins:02d}<span style='font-size: 0.6em; color: #888;'>分</span></div>",
-        unsafe_allow_html=True,
-    )
-    st.markdown(
-        "<div class='kpi-label' style='text-align: center; margin-top: -10px;'>残り生産時間</div>",
-        unsafe_allow_html=True,
+    hours, mins = divmod(data.remain_min, 60)
+    status_class, status_text = get_status_info(data.alarm, progress, data.in_operating)
+    return (
+        f"<div class='kpi-value-big' style='text-align: center;'>{hours:02d}<span style='font-size: 0.6em; color: #888;'>時間</span>{mins:02d}<span style='font-size: 0.6em; color: #888;'>分</span></div>"
+        "<div class='kpi-label' style='text-align: center;'>残り生産時間</div>"
+        f"<div class='{status_class}' style='text-align: center; margin-top: 1rem;'>{status_text}</div>"
     )
 
-    status_class, status_text = get_status_info(data.alarm, progress, data.in_operating)
+
+def render_production_panel(
+    data: ProductionData, progress: float, alarm: bool = False, theme: str = "dark"
+) -> None:
+    """生産数量メトリクス(左)と残り時間・ステータス(右)を横並びでレンダリング
+
+    st.columnsは列ごとにコンテナ要素を生成するため、
+    CSSグリッドで2列に並べて1回のst.markdownで描画する。
+
+    Args:
+        data: 生産データ
+        progress: 進捗率 (0.0-1.0)
+        alarm: 異常フラグ (Trueの場合、進捗バーが赤くなる)
+        theme: "dark" または "light"
+    """
     st.markdown(
-        f"<div class='{status_class}' style='text-align: center; margin-top: 1rem;'>{status_text}</div>",
+        "<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;'>"
+        f"<div>{_production_metrics_html(data, progress, alarm, theme)}</div>"
+        f"<div>{_time_and_status_html(data, progress)}</div>"
+        "</div>",
         unsafe_allow_html=True,
     )
 
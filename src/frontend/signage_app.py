@@ -8,12 +8,10 @@ PLC通信はバックエンドに委譲し、フロントエンドは表示に
 """
 
 import sys
-import gc
 from pathlib import Path
 import tempfile
 
 import streamlit as st
-from streamlit_autorefresh import st_autorefresh
 from dotenv import load_dotenv
 
 # プロジェクトルートをパスに追加
@@ -26,8 +24,7 @@ from frontend.styles import get_page_styles
 from frontend.components import (
     get_gauge_figure,
     render_header,
-    render_production_metrics,
-    render_time_and_status,
+    render_production_panel,
     render_alarm_bar,
 )
 from frontend.api_client import (
@@ -36,19 +33,16 @@ from frontend.api_client import (
     request_time_sync,
 )
 from schemas import ProductionData
-from config.settings import Settings
-from backend.config_helpers import get_refresh_interval
+from backend.config_helpers import get_refresh_interval, get_theme
 from backend.logging import app_logger as logger
 
 # --------------------------
 #  定数定義
 # --------------------------
-settings = Settings()
+# Streamlitは再描画ごとにスクリプトを再実行するため、Settings()を毎回生成せず
+# インポート済みモジュールにキャッシュされた設定を参照する
 REFRESH_INTERVAL = get_refresh_interval()
-THEME = settings.THEME  # UIテーマ (dark/light)
-
-# メモリクリーンアップ間隔 (リフレッシュ回数)
-GC_INTERVAL = 100  # 100回リフレッシュごとにGC実行 (約5分@3秒間隔)
+THEME = get_theme()  # UIテーマ (dark/light)
 
 # 初期化フラグファイル（セッションリセット対策）
 # /tmp は再起動でクリアされるので、起動ごとに1回だけ初期化される
@@ -139,67 +133,51 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# --------------------------
-#  自動更新
-# --------------------------
-st_autorefresh(interval=REFRESH_INTERVAL * 1000, key="datarefresh")
 
 # --------------------------
-#  定期メモリクリーンアップ
+#  自動更新 (フラグメント)
 # --------------------------
-# リフレッシュカウンタを初期化
-if "refresh_count" not in st.session_state:
-    st.session_state["refresh_count"] = 0
+# ページ全体を再実行すると設定・CSS・初期化判定まで毎回走るため、
+# データ取得と描画部分だけをREFRESH_INTERVAL秒ごとに再実行する
+@st.fragment(run_every=REFRESH_INTERVAL)
+def render_dashboard() -> None:
+    """生産データを取得して画面を描画する (REFRESH_INTERVAL秒ごとに再実行)"""
+    # --------------------------
+    #  データ取得
+    # --------------------------
+    data = get_production_data()
 
-st.session_state["refresh_count"] += 1
+    # --------------------------
+    #  レンダリング（エラー時も更新継続）
+    # --------------------------
+    try:
+        # ===== ヘッダ =====
+        render_header(data)
+        st.markdown("---")
 
-# 一定間隔でガベージコレクション実行
-if st.session_state["refresh_count"] >= GC_INTERVAL:
-    collected = gc.collect()
-    logger.debug(f"GC collected {collected} objects")
-    st.session_state["refresh_count"] = 0
+        # 進捗率計算
+        progress = min(1.0, data.actual / data.plan) if data.plan else 0
 
-# --------------------------
-#  データ取得
-# --------------------------
-data = get_production_data()
+        # ===== メイン: ゲージ =====
+        gauge_fig = get_gauge_figure(progress, theme=THEME, alarm=data.alarm)
+        st.plotly_chart(gauge_fig, width="stretch")
 
-# --------------------------
-#  レンダリング（エラー時も更新継続）
-# --------------------------
-try:
-    # ===== ヘッダ =====
-    render_header(data)
-    st.markdown("---")
-
-    # 進捗率計算
-    progress = min(1.0, data.actual / data.plan) if data.plan else 0
-
-    # ===== メイン: ゲージ =====
-    gauge_fig = get_gauge_figure(progress, theme=THEME, alarm=data.alarm)
-    st.plotly_chart(gauge_fig, width="stretch")
-
-    # ===== 下部: 生産情報 =====
-    col_left, col_right = st.columns(2)
-
-    # ---- 左：生産数量 ----
-    with col_left:
-        render_production_metrics(data, progress, alarm=data.alarm, theme=THEME)
-
-    # ---- 右：残り時間 ＋ ステータス ----
-    with col_right:
-        render_time_and_status(data, progress)
-
-    # ===== 下段：異常バー =====
-    st.markdown("---")
-    render_alarm_bar(data)
-
-except Exception as e:
-    # レンダリングエラー時も画面を維持し、更新を継続
-    logger.error(f"Rendering error: {e}")
-    st.error(f"表示エラー: {e}")
-    st.markdown("---")
-    st.warning("データ取得は継続中です。最新情報の取得をお待ちください。")
+        # ===== 下部: 生産情報 (左: 生産数量 / 右: 残り時間 ＋ ステータス) =====
+        render_production_panel(data, progress, alarm=data.alarm, theme=THEME)
+
+        # ===== 下段：異常バー =====
+        st.markdown("---")
+        render_alarm_bar(data)
+
+    except Exception as e:
+        # レンダリングエラー時も画面を維持し、更新を継続
+        logger.error(f"Rendering error: {e}")
+        st.error(f"表示エラー: {e}")
+        st.markdown("---")
+        st.warning("データ取得は継続中です。最新情報の取得をお待ちください。")
+
+
+render_dashboard()
 
 st.markdown(
     f"<div class='footer'>更新間隔：{REFRESH_INTERVAL}秒 / Powered by Streamlit + FastAPI</div>",
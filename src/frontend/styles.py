@@ -4,66 +4,82 @@
 ライトモード/ダークモードの切り替えに対応。
 """
 
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 
-def get_theme_colors(theme: str = "dark") -> dict[str, str]:
+# CSS縮小用の正規表現 (コメント / 連続する空白 / 記号前後の空白)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE = re.compile(r"\s+")
+_CSS_SYMBOL_SPACE = re.compile(r"\s*([{};:>,])\s*")
+
+# テーマごとの色設定 (リフレッシュごとに辞書を生成しないよう読み取り専用で共有)
+_LIGHT_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "bg_color": "#ffffff",
+        "text_color": "#000000",
+        "text_secondary": "#555555",
+        "header_color": "#1a1a1a",
+        "kpi_label_color": "#666666",
+        "kpi_value_color": "#000000",
+        "kpi_sub_color": "#333333",
+        "gauge_bg": "#f5f5f5",
+        "gauge_bar": "#31c77f",
+        "gauge_step_1": "#e0e0e0",
+        "gauge_step_2": "#c0c0c0",
+        "status_ok_bg": "#c8e6c9",
+        "status_ok_border": "#4caf50",
+        "status_warn_bg": "#fff9c4",
+        "status_warn_border": "#ffc107",
+        "status_alarm_bg": "#ffcdd2",
+        "status_alarm_border": "#f44336",
+        "alarm_bar_ok_bg": "#81c784",
+        "alarm_bar_error_bg": "#ff0000",
+        "hr_color": "#e0e0e0",
+        "progress_color": "#31c77f",
+    }
+)
+_DARK_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "bg_color": "#000000",
+        "text_color": "#f5f5f5",
+        "text_secondary": "#d0d0d0",
+        "header_color": "#ffffff",
+        "kpi_label_color": "#bbbbbb",
+        "kpi_value_color": "#ffffff",
+        "kpi_sub_color": "#cccccc",
+        "gauge_bg": "#000000",
+        "gauge_bar": "#31c77f",
+        "gauge_step_1": "#333333",
+        "gauge_step_2": "#555555",
+        "status_ok_bg": "#145c32",
+        "status_ok_border": "#1f7e46",
+        "status_warn_bg": "#744000",
+        "status_warn_border": "#f0a000",
+        "status_alarm_bg": "#7a0000",
+        "status_alarm_border": "#ff3333",
+        "alarm_bar_ok_bg": "#145c32",
+        "alarm_bar_error_bg": "#ff0000",
+        "hr_color": "#333333",
+        "progress_color": "#31c77f",
+    }
+)
+
+
+def get_theme_colors(theme: str = "dark") -> Mapping[str, str]:
     """テーマに応じた色設定を取得
 
     Args:
         theme: "dark" または "light"
 
     Returns:
-        dict[str, str]: 色設定辞書
+        Mapping[str, str]: 色設定 (読み取り専用、呼び出し間で共有)
     """
-    if theme == "light":
-        return {
-            "bg_color": "#ffffff",
-            "text_color": "#000000",
-            "text_secondary": "#555555",
-            "header_color": "#1a1a1a",
-            "kpi_label_color": "#666666",
-            "kpi_value_color": "#000000",
-            "kpi_sub_color": "#333333",
-            "gauge_bg": "#f5f5f5",
-            "gauge_bar": "#31c77f",
-            "gauge_step_1": "#e0e0e0",
-            "gauge_step_2": "#c0c0c0",
-            "status_ok_bg": "#c8e6c9",
-            "status_ok_border": "#4caf50",
-            "status_warn_bg": "#fff9c4",
-            "status_warn_border": "#ffc107",
-            "status_alarm_bg": "#ffcdd2",
-            "status_alarm_border": "#f44336",
-            "alarm_bar_ok_bg": "#81c784",
-            "alarm_bar_error_bg": "#ff0000",
-            "hr_color": "#e0e0e0",
-            "progress_color": "#31c77f",
-        }
-    else:  # dark (デフォルト)
-        return {
-            "bg_color": "#000000",
-            "text_color": "#f5f5f5",
-            "text_secondary": "#d0d0d0",
-            "header_color": "#ffffff",
-            "kpi_label_color": "#bbbbbb",
-            "kpi_value_color": "#ffffff",
-            "kpi_sub_color": "#cccccc",
-            "gauge_bg": "#000000",
-            "gauge_bar": "#31c77f",
-            "gauge_step_1": "#333333",
-            "gauge_step_2": "#555555",
-            "status_ok_bg": "#145c32",
-            "status_ok_border": "#1f7e46",
-            "status_warn_bg": "#744000",
-            "status_warn_border": "#f0a000",
-            "status_alarm_bg": "#7a0000",
-            "status_alarm_border": "#ff3333",
-            "alarm_bar_ok_bg": "#145c32",
-            "alarm_bar_error_bg": "#ff0000",
-            "hr_color": "#333333",
-            "progress_color": "#31c77f",
-        }
+    return _LIGHT_COLORS if theme == "light" else _DARK_COLORS  # 既定はdark
 
 
+@lru_cache(maxsize=2)
 def get_page_styles(theme: str = "dark") -> str:
     """ページ全体のカスタムCSSスタイルを取得 (テーマ対応)
 
@@ -75,10 +91,15 @@ def get_page_styles(theme: str = "dark") -> str:
 
     Returns:
         str: HTML <style>タグを含むCSS文字列
+
+    Note:
+        Streamlitはリフレッシュごとにページスクリプトを再実行するため、
+        テーマごとに生成したCSSをキャッシュして再利用する。
+        ブラウザへの送信量を減らすため、コメントと空白を除去して返す。
     """
     colors = get_theme_colors(theme)
 
-    return f"""
+    return _minify_css(f"""
     <style>
     /* Streamlitのヘッダーを非表示 */
     header {{
@@ -199,4 +220,22 @@ def get_page_styles(theme: str = "dark") -> str:
         border-color: {colors["hr_color"]};
     }}
     </style>
-"""
+""")
+
+
+def _minify_css(css: str) -> str:
+    """CSS文字列からコメントと不要な空白を除去する
+
+    Args:
+        css: <style>タグを含むCSS文字列
+
+    Returns:
+        str: 1行に縮小したCSS文字列
+
+    Examples:
+        >>> _minify_css("<style> a { color: red; } </style>")
+        '<style>a{color:red;}</style>'
+    """
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    return _CSS_SYMBOL_SPACE.sub(r"\1", css).strip()
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
 
@@ -27,7 +29,9 @@ class ProductionTypeConfig(BaseModel):
     fully: int = Field(gt=0, description="1パレットあたりの積載数")
     seconds_per_product: float = Field(gt=0, description="1個あたりの生産時間(秒)")
 
+    # 機種設定はアプリ全体で共有されるため変更不可とする
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "production_type": 1,
@@ -35,9 +39,30 @@ class ProductionTypeConfig(BaseModel):
                 "fully": 2800,  # 140個 × 20段
                 "seconds_per_product": 1.2,  # 1個あたり1.2秒 (50個/分)
             }
-        }
+        },
     }
 
+    @cached_property
+    def inv_fully(self) -> float:
+        """1パレットあたりの積載数の逆数 (残りパレット数計算用)
+
+        毎回の除算を乗算に置き換えるため、初回参照時に1回だけ計算する。
+        モデルのフィールドではないため、JSON出力には含まれない。
+
+        Returns:
+            float: 1 / fully
+        """
+        return 1.0 / self.fully
+
+    @cached_property
+    def minutes_per_product(self) -> float:
+        """1個あたりの生産時間(分) (残り時間計算用)
+
+        Returns:
+            float: seconds_per_product / 60
+        """
+        return self.seconds_per_product / 60.0
+
     @classmethod
     def example(cls) -> "ProductionTypeConfig":
         """デフォルトの例を返す
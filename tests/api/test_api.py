@@ -62,6 +62,30 @@ class TestSystemEndpoint:
             assert field in fields, f"Missing field: {field}"
 
 
+class TestLifespan:
+    """アプリケーションのライフサイクル管理のテスト"""
+
+    def test_startup_initializes_production_config(self) -> None:
+        """起動時に設定のLINE_NAMEで機種マスタを初期化すること"""
+        import asyncio
+
+        from api import main
+
+        async def run_lifespan() -> None:
+            async with main.lifespan(main.app):
+                pass
+
+        with (
+            patch.object(main, "ProductionConfigManager") as mock_manager,
+            patch.object(main, "plc_service") as mock_service,
+        ):
+            asyncio.run(run_lifespan())
+
+        mock_manager.initialize.assert_called_once_with(main.get_settings().LINE_NAME)
+        mock_service.initialize.assert_called_once()
+        mock_service.shutdown.assert_called_once()
+
+
 class TestPLCService:
     """PLCServiceのテスト"""
 
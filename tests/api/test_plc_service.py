@@ -3,12 +3,16 @@
 タイムアウト機構、連続失敗処理、フェイルセーフのテスト。
 """
 
+import asyncio
 import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from backend.plc.plc_fetcher import default_error_data, is_error_data
+from schemas import ProductionData
+
 
 class TestPLCServiceTimeout:
     """PLCサービスのタイムアウト機構テスト"""
@@ -165,6 +169,120 @@ class TestPLCServiceDummyData:
             assert data.plan > 0
             assert isinstance(data.timestamp, datetime)
 
+    def test_aget_production_data_returns_dummy(self, plc_service):
+        """非同期版も同期版と同じデータを返す"""
+        mock_config = MagicMock()
+        mock_config.name = "テスト機種"
+        mock_config.fully = 100
+
+        with patch(
+            "api.services.plc_service.get_config_data", return_value=mock_config
+        ):
+            data = asyncio.run(plc_service.aget_production_data())
+
+            assert data.line_name == "TEST_LINE"
+            assert data.production_name == "テスト機種"
+
+
+class TestPLCServiceDataReuse:
+    """生産データの再利用 (複数画面からの要求の集約) テスト"""
+
+    @staticmethod
+    def _make_data() -> ProductionData:
+        """正常に取得できた生産データを作成"""
+        return ProductionData(
+            line_name="LINE_1",
+            production_type=1,
+            production_name="機種A",
+            plan=100,
+            actual=50,
+            remain_min=10,
+            remain_pallet=1.0,
+            fully=10,
+        )
+
+    @pytest.fixture
+    def plc_service(self):
+        """USE_PLC=true・更新間隔10秒のPLCServiceを作成"""
+        mock_settings = MagicMock()
+        mock_settings.PLC_FETCH_TIMEOUT = 3.0
+        mock_settings.PLC_FETCH_FAILURE_LIMIT = 5
+        mock_settings.REFRESH_INTERVAL = 10.0
+
+        with (
+            patch("api.services.plc_service.Settings", return_value=mock_settings),
+            patch("api.services.plc_service.get_use_plc", return_value=True),
+        ):
+            from api.services.plc_service import PLCService
+
+            PLCService._instance = None
+            PLCService._initialized = False
+            service = PLCService()
+            service._client = MagicMock()
+            service._fetch_production_data = MagicMock(
+                side_effect=lambda client: self._make_data()
+            )
+            service._is_error_data = is_error_data
+            return service
+
+    def test_reuses_recent_data(self, plc_service):
+        """再利用期間内の要求はPLCを読まずに前回の結果を返すか"""
+        first = plc_service.get_production_data()
+        second = plc_service.get_production_data()
+
+        assert second is first
+        plc_service._fetch_production_data.assert_called_once()
+
+    def test_fetches_again_after_window(self, plc_service):
+        """再利用期間 (更新間隔の半分) を過ぎたら再取得するか"""
+        with patch("api.services.plc_service.time.monotonic", return_value=100.0):
+            first = plc_service.get_production_data()
+        with patch("api.services.plc_service.time.monotonic", return_value=105.0):
+            second = plc_service.get_production_data()
+
+        assert second is not first
+        assert plc_service._fetch_production_data.call_count == 2
+
+    def test_window_starts_after_fetch(self, plc_service):
+        """再利用期間が取得完了時点から数えられるか"""
+        clock = [100.0]
+
+        def slow_fetch(client):
+            clock[0] += 4.0  # 通信に4秒かかる
+            return self._make_data()
+
+        plc_service._fetch_production_data.side_effect = slow_fetch
+        with patch(
+            "api.services.plc_service.time.monotonic", side_effect=lambda: clock[0]
+        ):
+            first = plc_service.get_production_data()
+            clock[0] = 108.0  # 要求開始から8秒・取得完了から4秒
+            second = plc_service.get_production_data()
+
+        assert second is first
+        plc_service._fetch_production_data.assert_called_once()
+
+    def test_failure_is_not_cached(self, plc_service):
+        """取得失敗は記録されず、次の要求で再取得するか"""
+        data = self._make_data()
+        plc_service._fetch_production_data.side_effect = [
+            ConnectionError("PLC connection failed"),
+            data,
+        ]
+
+        with pytest.raises(ConnectionError):
+            plc_service.get_production_data()
+        assert plc_service.get_production_data() is data
+
+    def test_error_data_is_not_cached(self, plc_service):
+        """取得失敗時のエラーデータは再利用せず、次の要求で再取得するか"""
+        data = self._make_data()
+        plc_service._fetch_production_data.side_effect = [default_error_data(), data]
+
+        assert is_error_data(plc_service.get_production_data())
+        assert plc_service.get_production_data() is data
+        assert plc_service._fetch_production_data.call_count == 2
+
 
 class TestPLCServiceReadiness:
     """PLCサービスのレディネスチェックテスト"""
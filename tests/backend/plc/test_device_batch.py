@@ -0,0 +1,167 @@
+"""PLCデバイス一括読み取り計画のテスト"""
+
+import pytest
+
+from backend.plc.device_batch import (
+    BlockField,
+    DeviceAddress,
+    ReadBlock,
+    build_read_blocks,
+    expand_bit_block_words,
+    expand_block_devices,
+    is_bit_device,
+    parse_device_address,
+    unpack_bit_words,
+)
+
+
+class TestParseDeviceAddress:
+    """parse_device_address関数のテスト"""
+
+    def test_decimal_device(self):
+        """10進デバイスを解析できるか"""
+        assert parse_device_address("D100") == DeviceAddress("D", 100)
+        assert parse_device_address("SD210") == DeviceAddress("SD", 210)
+
+    def test_hex_device(self):
+        """16進デバイスを解析できるか"""
+        assert parse_device_address("X1F") == DeviceAddress("X", 0x1F)
+        assert parse_device_address("W1A0") == DeviceAddress("W", 0x1A0)
+
+    def test_invalid_device_returns_none(self):
+        """空文字・不正な形式はNoneを返すか"""
+        assert parse_device_address("") is None
+        assert parse_device_address("100") is None
+        assert parse_device_address("D1A") is None
+
+    def test_format_roundtrip(self):
+        """解析結果をデバイス名に戻せるか"""
+        assert DeviceAddress("D", 100).format() == "D100"
+        assert DeviceAddress("W", 0x1A).format() == "W1A"
+
+
+class TestBuildReadBlocks:
+    """build_read_blocks関数のテスト"""
+
+    def test_contiguous_fields_merge_into_one_block(self):
+        """連続したアドレスが1ブロックにまとまるか"""
+        blocks, unbatched = build_read_blocks(
+            {
+                "type": ("D100", 1),
+                "plan": ("D101", 2),
+                "actual": ("D103", 2),
+            }
+        )
+
+        assert unbatched == []
+        assert len(blocks) == 1
+        assert blocks[0].head_device == "D100"
+        assert blocks[0].size == 5
+        assert blocks[0].fields == (
+            BlockField("type", 0, 1),
+            BlockField("plan", 1, 2),
+            BlockField("actual", 3, 2),
+        )
+
+    def test_different_prefixes_are_separate_blocks(self):
+        """デバイス種別が異なれば別ブロックになるか"""
+        blocks, _ = build_read_blocks({"time": ("SD210", 3), "type": ("D100", 1)})
+
+        assert sorted(b.head_device for b in blocks) == ["D100", "SD210"]
+
+    def test_distant_fields_are_split(self):
+        """間隔がmax_gapを超えると別ブロックになるか"""
+        blocks, _ = build_read_blocks(
+            {"a": ("D100", 1), "b": ("D105", 1), "c": ("D200", 1)}, max_gap=8
+        )
+
+        assert [(b.head_device, b.size) for b in blocks] == [
+            ("D100", 6),
+            ("D200", 1),
+        ]
+
+    def test_overlapping_fields_share_words(self):
+        """重なったアドレス範囲でもブロックサイズが正しいか"""
+        blocks, _ = build_read_blocks({"plan": ("D101", 2), "actual": ("D102", 2)})
+
+        assert blocks[0].size == 3
+
+    def test_unparseable_fields_are_reported(self):
+        """解析できないデバイスは個別読み取り対象として返されるか"""
+        blocks, unbatched = build_read_blocks({"a": ("", 1), "b": ("D100", 1)})
+
+        assert unbatched == ["a"]
+        assert len(blocks) == 1
+
+    def test_flags_on_word_devices_are_not_merged(self):
+        """ビット項目はワードデバイス上なら結合せず、ビットデバイス上なら結合するか"""
+        blocks, _ = build_read_blocks(
+            {
+                "alarm": ("D103", 1),
+                "in_operating": ("D105", 1),
+                "run": ("M100", 1),
+                "stop": ("M101", 1),
+            },
+            bits=True,
+        )
+
+        assert sorted((b.head_device, b.size) for b in blocks) == [
+            ("D103", 1),
+            ("D105", 1),
+            ("M100", 2),
+        ]
+
+    def test_is_bit_device(self):
+        """ビットデバイスとワードデバイスを判別できるか"""
+        assert is_bit_device("M100")
+        assert is_bit_device("X1F")
+        assert is_bit_device("SM400")
+        assert not is_bit_device("D100")
+        assert not is_bit_device("SD210")
+        assert not is_bit_device("")
+
+
+class TestExpandBlockDevices:
+    """expand_block_devices関数のテスト"""
+
+    def test_decimal_block(self):
+        """10進デバイスのブロックを1点ずつ展開できるか"""
+        block = ReadBlock("SD210", 3, ())
+        assert expand_block_devices(block) == ["SD210", "SD211", "SD212"]
+
+    def test_hex_block(self):
+        """16進デバイスは16進で採番されるか"""
+        block = ReadBlock("W1E", 3, ())
+        assert expand_block_devices(block) == ["W1E", "W1F", "W20"]
+
+    def test_invalid_head_device_raises(self):
+        """先頭デバイスが解析できない場合ValueErrorを送出するか"""
+        with pytest.raises(ValueError):
+            expand_block_devices(ReadBlock("", 1, ()))
+
+
+class TestBitBlockWords:
+    """ビットブロックのワード単位読み取り関連関数のテスト"""
+
+    def test_expand_bit_block_by_16_points(self):
+        """ビットブロックを16点ごとの先頭デバイスに展開できるか"""
+        assert expand_bit_block_words(ReadBlock("M100", 2, ())) == ["M100"]
+        assert expand_bit_block_words(ReadBlock("M100", 17, ())) == ["M100", "M116"]
+
+    def test_expand_hex_bit_block(self):
+        """16進デバイスは16進で採番されるか"""
+        assert expand_bit_block_words(ReadBlock("X1F", 20, ())) == ["X1F", "X2F"]
+
+    def test_expand_word_device_raises(self):
+        """ワードデバイスのブロックはワード単位に詰められずValueErrorを送出するか"""
+        with pytest.raises(ValueError):
+            expand_bit_block_words(ReadBlock("D103", 3, ()))
+
+    def test_unpack_lsb_first(self):
+        """各ワードの最下位ビットが先頭デバイスに対応するか"""
+        assert unpack_bit_words([0b0110, 0b1], 18) == [0, 1, 1] + [0] * 13 + [1, 0]
+
+    def test_unpack_short_data_raises(self):
+        """ワード数が不足している場合ValueErrorを送出するか"""
+        with pytest.raises(ValueError):
+            unpack_bit_words([0], 17)
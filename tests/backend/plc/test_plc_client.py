@@ -4,8 +4,9 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pymcprotocol import Type3E
 
-from backend.plc.plc_client import PLCClient
+from backend.plc.plc_client import PLCClient, to_signed16
 from backend.plc.plc_fetcher import fetch_production_timestamp
 
 
@@ -55,6 +56,18 @@ class TestFetchProductionTimestamp:
 
         assert before <= result <= after
 
+    def test_fetch_timestamp_invalid_bcd_nibble_fallback(self):
+        """BCDとして不正なニブル(A-F)を含む場合に現在時刻にフォールバックするか"""
+        mock_client = MagicMock(spec=PLCClient)
+        # 0x1A (秒) はBCDとして不正
+        mock_client.read_words.return_value = [0x2511, 0x1314, 0x301A]
+
+        before = datetime.now()
+        result = fetch_production_timestamp(mock_client, head_device="SD210")
+        after = datetime.now()
+
+        assert before <= result <= after
+
     def test_fetch_timestamp_empty_device_returns_system_time(self):
         """head_deviceが空文字列の場合にシステム時刻を返すか"""
         mock_client = MagicMock(spec=PLCClient)
@@ -67,6 +80,32 @@ class TestFetchProductionTimestamp:
         assert before <= result <= after
         mock_client.read_words.assert_not_called()
 
+    @patch("backend.plc.plc_fetcher.logger")
+    def test_fetch_timestamp_unset_clock_returns_system_time(self, mock_logger):
+        """PLCの時計が未設定(ゼロ)の場合に警告なしでシステム時刻を返すか"""
+        mock_client = MagicMock(spec=PLCClient)
+        mock_client.read_words.return_value = [0x0000, 0x0000, 0x0000]
+
+        before = datetime.now()
+        result = fetch_production_timestamp(mock_client, head_device="SD210")
+        after = datetime.now()
+
+        assert before <= result <= after
+        mock_logger.warning.assert_not_called()
+
+    def test_fetch_timestamp_reuses_result_for_same_words(self):
+        """同じ日時ワードが続く場合に前回のdatetimeを再利用するか"""
+        mock_client = MagicMock(spec=PLCClient)
+        mock_client.read_words.return_value = [0x2511, 0x1314, 0x3046]
+
+        first = fetch_production_timestamp(mock_client, head_device="SD210")
+        second = fetch_production_timestamp(mock_client, head_device="SD210")
+        mock_client.read_words.return_value = [0x2511, 0x1314, 0x3047]
+        third = fetch_production_timestamp(mock_client, head_device="SD210")
+
+        assert second is first
+        assert third == datetime(2025, 11, 13, 14, 30, 47)
+
 
 class TestPLCClientMocking:
     """PLCClientのモック化テスト"""
@@ -92,3 +131,289 @@ class TestPLCClientMocking:
 
         with pytest.raises(ConnectionError):
             mock_plc.batchread_wordunits(["D100"])
+
+
+class TestPLCClientLifecycle:
+    """PLCClientの接続ライフサイクルのテスト"""
+
+    @patch("backend.plc.plc_client.Type3E")
+    def test_context_manager_disconnects_on_exit(self, mock_type3e):
+        """with文を抜けるとPLC接続がクローズされるか"""
+        mock_plc = MagicMock()
+        mock_plc._sock = None
+        mock_type3e.return_value = mock_plc
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+
+        with PLCClient(settings) as client:
+            assert client.connected is True
+
+        mock_plc.close.assert_called_once()
+        assert client.connected is False
+
+    def test_no_finalizer_defined(self):
+        """GC中に切断処理が走らないよう__del__が定義されていないか"""
+        assert not hasattr(PLCClient, "__del__")
+
+
+class TestPLCClientReceiveBuffer:
+    """受信バッファ再利用のテスト"""
+
+    @patch("backend.plc.plc_client.Type3E")
+    def test_recv_reuses_preallocated_buffer(self, mock_type3e):
+        """応答が事前確保したバッファに受信されるか"""
+        mock_plc = MagicMock()
+        mock_plc._sock = None
+        mock_type3e.return_value = mock_plc
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        client = PLCClient(settings)
+
+        def fake_recv_into(view, size):
+            view[:4] = b"\xd0\x00\x12\x34"
+            return 4
+
+        mock_plc._sock = MagicMock()
+        mock_plc._sock.recv_into.side_effect = fake_recv_into
+
+        first = client._recv_view()
+        assert bytes(first) == b"\xd0\x00\x12\x34"
+        assert first.obj is client._rxbuf
+
+        second = client._recv_view()
+        assert second.obj is first.obj
+
+    def test_binary_mode_read_cputype(self):
+        """バイナリ通信でも.decode()するpymcprotocolのAPIが動くか"""
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+
+        # 3Eフレーム応答: サブヘッダ～終了コード(11バイト) + 形名16文字 + 形名コード
+        payload = b"Q03UDVCPU       " + b"\x6e\x03"
+        response = (
+            b"\xd0\x00\x00\xff\xff\x03\x00"
+            + (len(payload) + 2).to_bytes(2, "little")
+            + b"\x00\x00"
+            + payload
+        )
+
+        def fake_recv_into(view, size):
+            view[: len(response)] = response
+            return len(response)
+
+        client.plc._sock = MagicMock()
+        client.plc._sock.recv_into.side_effect = fake_recv_into
+        client.plc._is_connected = True
+
+        cpu_type, cpu_code = client.plc.read_cputype()
+
+        assert cpu_type.strip() == "Q03UDVCPU"
+        assert cpu_code == "036e"
+
+    def test_ascii_mode_returns_bytes(self):
+        """ASCII通信時はpymcprotocolのdecode処理が動くようbytesで返すか"""
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+        client.plc.setaccessopt(commtype="ascii")
+
+        # サブヘッダ～応答データ長 + 終了コード0000 + D100=0x0012
+        response = b"D00000FF03FF000008" + b"0000" + b"0012"
+
+        def fake_recv_into(view, size):
+            view[: len(response)] = response
+            return len(response)
+
+        client.plc._sock = MagicMock()
+        client.plc._sock.recv_into.side_effect = fake_recv_into
+        client.plc._is_connected = True
+
+        assert isinstance(client.plc._recv(), bytes)
+        assert client.plc.batchread_wordunits("D100", 1) == [0x12]
+
+
+class TestPLCClientDeviceCache:
+    """デバイス名解析キャッシュのテスト"""
+
+    def test_device_data_is_cached(self):
+        """同じデバイス名の解析結果がキャッシュから返されるか"""
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+
+        first = client.plc._make_devicedata("D100")
+        second = client.plc._make_devicedata("D100")
+
+        # D100 = デバイス番号100 (3バイト) + デバイスコード0xA8
+        assert first == b"\x64\x00\x00\xa8"
+        assert second is first
+        assert client._parse_device.cache_info().hits == 1
+
+    def test_cache_covers_random_read_points(self):
+        """ランダム読み出しの最大点数がキャッシュに収まるか"""
+        from backend.plc.device_batch import RANDOM_READ_MAX_POINTS
+
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+
+        assert client._parse_device.cache_info().maxsize >= RANDOM_READ_MAX_POINTS
+
+    def test_setaccessopt_clears_cache(self):
+        """通信形式を変更すると解析結果が作り直されるか"""
+        settings = MagicMock(PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1)
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+
+        binary = client.plc._make_devicedata("D100")
+        client.plc.setaccessopt(commtype="ascii")
+        ascii_data = client.plc._make_devicedata("D100")
+
+        assert client.plc.commtype == "ascii"
+        assert binary == b"\x64\x00\x00\xa8"
+        assert ascii_data == b"D*000100"
+
+    def test_reconnect_clears_cache(self):
+        """再接続時に解析キャッシュが破棄されるか"""
+        settings = MagicMock(
+            PLC_IP="127.0.0.1", PLC_PORT=5000, RECONNECT_RETRY=1, RECONNECT_DELAY=0
+        )
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+            client.plc._make_devicedata("D100")
+            assert client._parse_device.cache_info().currsize == 1
+
+            with patch.object(Type3E, "close"):
+                assert client.reconnect() is True
+
+        assert client._parse_device.cache_info().currsize == 0
+
+
+class TestPLCClientReadWordsRaw:
+    """read_words_rawのテスト"""
+
+    def _make_client(self, payload):
+        settings = MagicMock(
+            PLC_IP="127.0.0.1",
+            PLC_PORT=5000,
+            RECONNECT_RETRY=1,
+            DEBUG_DUMMY_READ=False,
+        )
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+        client.connected = True
+        # 3Eフレーム応答: サブヘッダ～終了コード(11バイト) + 応答データ
+        response = (
+            b"\xd0\x00\x00\xff\xff\x03\x00"
+            + (len(payload) + 2).to_bytes(2, "little")
+            + b"\x00\x00"
+            + payload
+        )
+
+        def fake_recv_into(view, size):
+            view[: len(response)] = response
+            return len(response)
+
+        client.plc._is_connected = True
+        client.plc._sock = MagicMock()
+        client.plc._sock.recv_into.side_effect = fake_recv_into
+        return client
+
+    def test_returns_words_as_big_endian_bytes(self):
+        """各ワードを上位バイト→下位バイトの順で返すか"""
+        # ワード値 0x4552 ("ER"), 0x524F ("RO") はリトルエンディアンで送られる
+        client = self._make_client(b"\x52\x45\x4f\x52")
+
+        result = client.read_words_raw("D700", size=2)
+
+        assert result == b"ERRO"
+        assert isinstance(result, bytes)
+        client.plc._sock.send.assert_called_once()
+
+    def test_short_response_raises_value_error(self):
+        """応答データが不足する場合ValueErrorを送出するか"""
+        client = self._make_client(b"\x52\x45")
+
+        with pytest.raises(ValueError):
+            client.read_words_raw("D700", size=2)
+
+
+class TestToSigned16:
+    """to_signed16関数のテスト"""
+
+    def test_small_list_uses_python_path(self):
+        """閾値未満のワード数で正しく変換されるか"""
+        assert to_signed16([0x0000, 0x7FFF, 0x8000, 0xFFFF]) == [0, 32767, -32768, -1]
+
+    def test_large_list_uses_bulk_path(self):
+        """閾値以上のワード数でも同じ結果になるか"""
+        words = [0x0000, 0x7FFF, 0x8000, 0xFFFF] * 4
+        assert to_signed16(words) == [0, 32767, -32768, -1] * 4
+
+    def test_empty_list(self):
+        """空リストは空リストを返す"""
+        assert to_signed16([]) == []
+
+
+class TestPLCClientEnsureConnected:
+    """ensure_connectedのヘルスチェック省略のテスト"""
+
+    def _make_client(self):
+        settings = MagicMock(
+            PLC_IP="127.0.0.1",
+            PLC_PORT=5000,
+            RECONNECT_RETRY=1,
+            DEBUG_DUMMY_READ=False,
+        )
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+        client.plc = MagicMock()
+        client.plc.batchread_wordunits.return_value = [0]
+        return client
+
+    def test_skips_probe_after_recent_read(self):
+        """直近に読み取りが成功していればSD0を読まないか"""
+        client = self._make_client()
+        client.read_words("D100")
+        client.plc.batchread_wordunits.reset_mock()
+
+        assert client.ensure_connected() is True
+        client.plc.batchread_wordunits.assert_not_called()
+
+    def test_probes_when_idle(self):
+        """通信実績がない場合はSD0でヘルスチェックするか"""
+        client = self._make_client()
+
+        assert client.ensure_connected() is True
+        client.plc.batchread_wordunits.assert_called_once_with("SD0", 1)
+
+    def test_probes_again_after_disconnect(self):
+        """切断後は通信実績がリセットされるか"""
+        client = self._make_client()
+        client.read_words("D100")
+        client.disconnect()
+
+        assert client._last_io_ok == 0.0
+
+
+class TestPLCClientReadRandomWords:
+    """read_random_wordsのテスト"""
+
+    def test_reads_devices_in_one_request(self):
+        """ランダム読出し1回で読み取り、16ビットにマスクして返すか"""
+        settings = MagicMock(
+            PLC_IP="127.0.0.1",
+            PLC_PORT=5000,
+            RECONNECT_RETRY=1,
+            DEBUG_DUMMY_READ=False,
+        )
+        with patch.object(Type3E, "connect"):
+            client = PLCClient(settings)
+        client.plc = MagicMock()
+        client.plc.randomread.return_value = ([1, -1, 0x2511], [])
+
+        result = client.read_random_words(["D100", "D101", "SD210"])
+
+        assert result == [1, 0xFFFF, 0x2511]
+        client.plc.randomread.assert_called_once_with(
+            word_devices=["D100", "D101", "SD210"], dword_devices=[]
+        )
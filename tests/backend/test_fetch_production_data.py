@@ -5,8 +5,15 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from backend.plc.plc_fetcher import fetch_production_data
+from backend.plc.device_batch import build_read_blocks
+from backend.plc.plc_fetcher import (
+    _random_read_devices,
+    _read_batched,
+    fetch_in_operating,
+    fetch_production_data,
+)
 from schemas.production import ProductionData
+from schemas.production_type import ProductionTypeConfig
 
 
 class TestFetchProductionData:
@@ -19,14 +26,12 @@ class TestFetchProductionData:
     @patch("backend.plc.plc_fetcher.fetch_actual")
     @patch("backend.plc.plc_fetcher.fetch_plan")
     @patch("backend.plc.plc_fetcher.fetch_production_type")
-    @patch("backend.plc.plc_fetcher.get_plc_device_dict")
-    @patch("backend.config_helpers.get_line_name")
-    @patch("backend.config_helpers.get_config_data")
+    @patch("backend.plc.plc_fetcher.get_line_name")
+    @patch("backend.plc.plc_fetcher.find_config_data")
     def test_fetch_production_data_returns_production_data(
         self,
         mock_get_config,
         mock_get_line_name,
-        mock_get_device_dict,
         mock_fetch_type,
         mock_fetch_plan,
         mock_fetch_actual,
@@ -43,15 +48,6 @@ class TestFetchProductionData:
         mock_config.fully = 2800
         mock_config.seconds_per_product = 1.2
         mock_get_config.return_value = mock_config
-        mock_get_device_dict.return_value = {
-            "TIME_DEVICE": "SD210",
-            "PRODUCTION_TYPE_DEVICE": "D200",
-            "PLAN_DEVICE": "D210",
-            "ACTUAL_DEVICE": "D220",
-            "ALARM_FLAG_DEVICE": "M310",
-            "ALARM_MSG_DEVICE": "D300",
-            "IN_OPERATING_DEVICE": "M300",
-        }
         mock_fetch_type.return_value = 1
         mock_fetch_plan.return_value = 30000
         mock_fetch_actual.return_value = 20000
@@ -82,14 +78,12 @@ class TestFetchProductionData:
     @patch("backend.plc.plc_fetcher.fetch_actual")
     @patch("backend.plc.plc_fetcher.fetch_plan")
     @patch("backend.plc.plc_fetcher.fetch_production_type")
-    @patch("backend.plc.plc_fetcher.get_plc_device_dict")
-    @patch("backend.config_helpers.get_line_name")
-    @patch("backend.config_helpers.get_config_data")
+    @patch("backend.plc.plc_fetcher.get_line_name")
+    @patch("backend.plc.plc_fetcher.find_config_data")
     def test_fetch_production_data_calculates_remain_values(
         self,
         mock_get_config,
         mock_get_line_name,
-        mock_get_device_dict,
         mock_fetch_type,
         mock_fetch_plan,
         mock_fetch_actual,
@@ -100,20 +94,9 @@ class TestFetchProductionData:
     ):
         """残り時間とパレット数が計算されるか"""
         mock_get_line_name.return_value = "TEST_LINE"
-        mock_config = MagicMock()
-        mock_config.name = "テスト機種"
-        mock_config.seconds_per_product = 1.2
-        mock_config.fully = 2800
-        mock_get_config.return_value = mock_config
-        mock_get_device_dict.return_value = {
-            "TIME_DEVICE": "SD210",
-            "PRODUCTION_TYPE_DEVICE": "D200",
-            "PLAN_DEVICE": "D210",
-            "ACTUAL_DEVICE": "D220",
-            "ALARM_FLAG_DEVICE": "M310",
-            "ALARM_MSG_DEVICE": "D300",
-            "IN_OPERATING_DEVICE": "M300",
-        }
+        mock_get_config.return_value = ProductionTypeConfig(
+            production_type=1, name="テスト機種", fully=2800, seconds_per_product=1.2
+        )
         mock_fetch_type.return_value = 1
         mock_fetch_plan.return_value = 30000
         mock_fetch_actual.return_value = 20000
@@ -139,14 +122,12 @@ class TestFetchProductionData:
     @patch("backend.plc.plc_fetcher.fetch_actual")
     @patch("backend.plc.plc_fetcher.fetch_plan")
     @patch("backend.plc.plc_fetcher.fetch_production_type")
-    @patch("backend.plc.plc_fetcher.get_plc_device_dict")
-    @patch("backend.config_helpers.get_line_name")
-    @patch("backend.config_helpers.get_config_data")
+    @patch("backend.plc.plc_fetcher.get_line_name")
+    @patch("backend.plc.plc_fetcher.find_config_data")
     def test_fetch_production_data_uses_plc_timestamp(
         self,
         mock_get_config,
         mock_get_line_name,
-        mock_get_device_dict,
         mock_fetch_type,
         mock_fetch_plan,
         mock_fetch_actual,
@@ -162,15 +143,6 @@ class TestFetchProductionData:
         mock_config.fully = 2800
         mock_config.seconds_per_product = 1.2
         mock_get_config.return_value = mock_config
-        mock_get_device_dict.return_value = {
-            "TIME_DEVICE": "SD210",
-            "PRODUCTION_TYPE_DEVICE": "D200",
-            "PLAN_DEVICE": "D210",
-            "ACTUAL_DEVICE": "D220",
-            "ALARM_FLAG_DEVICE": "M310",
-            "ALARM_MSG_DEVICE": "D300",
-            "IN_OPERATING_DEVICE": "M300",
-        }
         mock_fetch_type.return_value = 1
         mock_fetch_plan.return_value = 30000
         mock_fetch_actual.return_value = 20000
@@ -185,3 +157,187 @@ class TestFetchProductionData:
 
         # PLCから取得したタイムスタンプが使用される
         assert result.timestamp == datetime(2025, 11, 14, 15, 30, 45)
+
+
+class TestFetchProductionDataBatched:
+    """一括読み取り経路のテスト"""
+
+    WORD_BLOCKS, _ = build_read_blocks(
+        {
+            "production_type": ("D100", 1),
+            "plan": ("D101", 2),
+            "actual": ("D103", 2),
+            "alarm_msg": ("D105", 2),
+            "timestamp": ("SD210", 3),
+        }
+    )
+    BIT_BLOCKS, _ = build_read_blocks(
+        {"in_operating": ("M100", 1), "alarm": ("M101", 1)}
+    )
+
+    def _make_client(self):
+        responses = {
+            # type=1, plan=30000, actual=20000, "AB"
+            "D100": [1, 30000, 0, 20000, 0, 0x4142, 0x0000],
+            "SD210": [0x2511, 0x1314, 0x3045],
+            "M100": [1, 0],
+        }
+        memory = {
+            f"{head[:-3]}{int(head[-3:]) + i}": value
+            for head, words in responses.items()
+            for i, value in enumerate(words)
+        }
+        client = MagicMock()
+        client.ensure_connected.return_value = True
+        client.read_words.side_effect = lambda dev, size: responses[dev][:size]
+        client.read_bits.side_effect = lambda dev, size: responses[dev][:size]
+        client.read_random_words.side_effect = lambda devices: [
+            memory[dev] for dev in devices
+        ]
+        return client
+
+    def _fetch(self, client, word_blocks=None, bit_blocks=None):
+        with (
+            patch(
+                "backend.plc.plc_fetcher._WORD_READ_BLOCKS",
+                self.WORD_BLOCKS if word_blocks is None else word_blocks,
+            ),
+            patch(
+                "backend.plc.plc_fetcher._BIT_READ_BLOCKS",
+                self.BIT_BLOCKS if bit_blocks is None else bit_blocks,
+            ),
+        ):
+            return fetch_production_data(client)
+
+    def test_reads_word_blocks_in_one_request(self):
+        """ワード・ビットブロックをランダム読出し1回で読み取るか"""
+        client = self._make_client()
+        result = self._fetch(client)
+
+        client.read_random_words.assert_called_once()
+        devices = client.read_random_words.call_args.args[0]
+        assert devices[:2] == ("D100", "D101")
+        # ビットブロックは16点単位 (1ワード) で末尾に指定される
+        assert devices[-4:] == ("SD210", "SD211", "SD212", "M100")
+        client.read_words.assert_not_called()
+        client.read_bits.assert_not_called()
+        assert result.production_type == 1
+        assert result.plan == 30000
+        assert result.actual == 20000
+        assert result.in_operating is True
+        assert result.alarm is False
+        assert result.alarm_msg == "AB"
+        assert result.timestamp == datetime(2025, 11, 13, 14, 30, 45)
+
+    def test_single_block_skips_random_read(self):
+        """ブロックが合計1つならランダム読出しを使わないか"""
+        assert _random_read_devices(tuple(self.WORD_BLOCKS[:1])) == ()
+        assert _random_read_devices((), tuple(self.BIT_BLOCKS)) == ()
+
+    @patch("backend.plc.plc_fetcher._random_read_devices", return_value=())
+    def test_block_reads_without_random_read(self, _mock_devices):
+        """ランダム読出しを使わない場合はブロックごとに1回ずつ読み取るか"""
+        client = self._make_client()
+        result = self._fetch(client)
+
+        client.read_random_words.assert_not_called()
+        client.read_words.assert_any_call("D100", size=7)
+        client.read_bits.assert_called_once_with("M100", size=2)
+        assert result.plan == 30000
+        assert result.in_operating is True
+
+    @patch("backend.plc.plc_fetcher.fetch_production_type")
+    def test_falls_back_to_per_field_read_on_block_failure(self, mock_fetch_type):
+        """ブロック読み取り失敗時に個別読み取りへフォールバックするか"""
+        mock_fetch_type.return_value = 2
+        client = self._make_client()
+        client.read_random_words.side_effect = ConnectionError("PLC connection failed")
+        client.read_words.side_effect = ConnectionError("PLC connection failed")
+        client.read_words_raw.side_effect = ConnectionError("PLC connection failed")
+        result = self._fetch(client)
+
+        mock_fetch_type.assert_called_once()
+        assert result.production_type == 2
+        # ランダム読出し失敗時もビットブロックは個別に読み取る
+        client.read_bits.assert_called_once_with("M100", size=2)
+        assert result.in_operating is True
+
+
+class TestWordDeviceFlags:
+    """ワードデバイスに格納されたフラグの読み取りテスト"""
+
+    BIT_BLOCKS, _ = build_read_blocks(
+        {"alarm": ("D103", 1), "in_operating": ("D105", 1)}, bits=True
+    )
+
+    @patch("backend.plc.plc_fetcher._random_read_devices", return_value=())
+    def test_word_flags_are_read_as_words(self, _mock_devices):
+        """ワードデバイスのフラグを1ワードずつ読み、0以外をONとするか"""
+        client = MagicMock()
+        client.read_words.side_effect = lambda dev, size: {"D103": [2], "D105": [0]}[
+            dev
+        ]
+
+        values = _read_batched(client, [], self.BIT_BLOCKS)
+
+        client.read_bits.assert_not_called()
+        assert values == {"alarm": [1], "in_operating": [0]}
+
+    def test_per_field_fallback_reads_word(self):
+        """個別読み取りでもワードデバイスのフラグをワードで読むか"""
+        client = MagicMock()
+        client.read_words.return_value = [1]
+
+        assert fetch_in_operating(client, "D105") is True
+        client.read_words.assert_called_once_with("D105", size=1)
+        client.read_bits.assert_not_called()
+
+
+class TestEnvExampleDevices:
+    """.env.exampleのデバイス割り付け (フラグがワードデバイス) での一括読み取りテスト"""
+
+    WORD_BLOCKS, _ = build_read_blocks(
+        {
+            "production_type": ("D100", 1),
+            "plan": ("D101", 2),
+            "actual": ("D102", 2),
+            "alarm_msg": ("D104", 16),
+            "timestamp": ("SD210", 3),
+        }
+    )
+    BIT_BLOCKS, _ = build_read_blocks(
+        {"in_operating": ("D105", 1), "alarm": ("D103", 1)}, bits=True
+    )
+
+    def _fetch(self, memory):
+        client = MagicMock()
+        client.ensure_connected.return_value = True
+        client.read_random_words.side_effect = lambda devices: [
+            memory.get(dev, 0) for dev in devices
+        ]
+        with (
+            patch("backend.plc.plc_fetcher._WORD_READ_BLOCKS", self.WORD_BLOCKS),
+            patch("backend.plc.plc_fetcher._BIT_READ_BLOCKS", self.BIT_BLOCKS),
+        ):
+            return client, fetch_production_data(client)
+
+    def test_flags_read_from_their_own_words(self):
+        """各フラグを自身のワードから読み、他のワードのビットと混同しないか"""
+        # D103のビット2がONでも、稼働中フラグ(D105)は0のまま
+        client, result = self._fetch(
+            {"D100": 1, "D103": 0b100, "D105": 0, "SD210": 0x2511, "SD211": 0x1314}
+        )
+
+        client.read_random_words.assert_called_once()
+        devices = client.read_random_words.call_args.args[0]
+        assert sorted(devices[-2:]) == ["D103", "D105"]
+        client.read_bits.assert_not_called()
+        assert result.alarm is True
+        assert result.in_operating is False
+
+    def test_in_operating_on(self):
+        """稼働中フラグのワードが0以外ならONとなるか"""
+        _, result = self._fetch({"D100": 1, "D103": 0, "D105": 1})
+
+        assert result.alarm is False
+        assert result.in_operating is True
@@ -0,0 +1,96 @@
+"""backend.system_utilsのテスト"""
+
+import errno
+import subprocess
+from datetime import datetime
+from unittest.mock import MagicMock, mock_open, patch
+
+import pytest
+
+from backend.system_utils import _clock_settime, is_raspberry_pi, set_system_clock
+
+
+class TestClockSettime:
+    """_clock_settime関数のテスト (libcはモック)"""
+
+    @patch("backend.system_utils._load_libc")
+    def test_passes_epoch_seconds_and_nanoseconds(self, mock_load_libc):
+        """エポック秒とナノ秒をtimespecに設定して呼び出すか"""
+        libc = MagicMock()
+        libc.clock_settime.return_value = 0
+        mock_load_libc.return_value = libc
+        target = datetime(2025, 11, 13, 14, 30, 45, 250000)
+
+        _clock_settime(target)
+
+        clock_id, spec_ref = libc.clock_settime.call_args.args
+        spec = spec_ref._obj
+        assert clock_id == 0
+        assert spec.tv_sec == int(target.replace(microsecond=0).timestamp())
+        assert spec.tv_nsec == 250_000_000
+
+    @patch("backend.system_utils.ctypes.get_errno", return_value=errno.EPERM)
+    @patch("backend.system_utils._load_libc")
+    def test_raises_permission_error_on_eperm(self, mock_load_libc, _mock_errno):
+        """EPERMの場合PermissionErrorを送出するか"""
+        mock_load_libc.return_value.clock_settime.return_value = -1
+
+        with pytest.raises(PermissionError):
+            _clock_settime(datetime(2025, 1, 1))
+
+
+class TestSetSystemClock:
+    """set_system_clock関数のテスト (Linux経路)"""
+
+    @patch("backend.system_utils.is_windows", return_value=False)
+    @patch("backend.system_utils.subprocess.run")
+    @patch("backend.system_utils._clock_settime")
+    def test_uses_syscall_without_subprocess(
+        self, mock_settime, mock_run, _mock_is_windows
+    ):
+        """clock_settimeが成功した場合はdateコマンドを実行しないか"""
+        assert set_system_clock(datetime(2025, 1, 1)) is True
+
+        mock_settime.assert_called_once()
+        mock_run.assert_not_called()
+
+    @patch("backend.system_utils.is_windows", return_value=False)
+    @patch("backend.system_utils.subprocess.run")
+    @patch("backend.system_utils._clock_settime", side_effect=PermissionError)
+    def test_falls_back_to_sudo_date_on_permission_error(
+        self, _mock_settime, mock_run, _mock_is_windows
+    ):
+        """権限不足の場合sudo dateにフォールバックするか"""
+        assert set_system_clock(datetime(2025, 11, 13, 14, 30, 45)) is True
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["sudo", "date", "111314302025.45"]
+
+    @patch("backend.system_utils.is_windows", return_value=False)
+    @patch(
+        "backend.system_utils.subprocess.run",
+        side_effect=subprocess.CalledProcessError(1, "date", stderr="denied"),
+    )
+    @patch("backend.system_utils._clock_settime", side_effect=PermissionError)
+    def test_returns_false_when_fallback_fails(
+        self, _mock_settime, _mock_run, _mock_is_windows
+    ):
+        """フォールバックも失敗した場合Falseを返すか"""
+        assert set_system_clock(datetime(2025, 1, 1)) is False
+
+
+class TestPlatformDetection:
+    """プラットフォーム判定関数のテスト"""
+
+    def test_is_raspberry_pi_reads_model_file_once(self):
+        """/proc/device-tree/modelの読み取りが初回のみか"""
+        is_raspberry_pi.cache_clear()
+        try:
+            with patch(
+                "builtins.open", mock_open(read_data="Raspberry Pi 4 Model B")
+            ) as mocked_open:
+                assert is_raspberry_pi() is True
+                assert is_raspberry_pi() is True
+            mocked_open.assert_called_once()
+        finally:
+            is_raspberry_pi.cache_clear()
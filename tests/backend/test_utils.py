@@ -1,5 +1,7 @@
 """backend.utilsのテスト"""
 
+from unittest.mock import patch
+
 import pytest
 
 from backend.calculators import calculate_remain_minutes, calculate_remain_pallet
@@ -7,8 +9,11 @@ from backend.config_helpers import (
     get_line_name,
     get_log_level,
     get_refresh_interval,
+    get_theme,
     get_use_plc,
 )
+from config.settings import Theme
+from schemas import ProductionTypeConfig
 
 
 class TestEnvironmentVariableHelpers:
@@ -33,6 +38,10 @@ class TestEnvironmentVariableHelpers:
         level = get_log_level()
         assert level in ("DEBUG", "INFO", "WARNING", "ERROR")
 
+    def test_get_theme_returns_theme(self):
+        """THEMEがTheme Enumで返されるか"""
+        assert isinstance(get_theme(), Theme)
+
 
 class TestCalculateRemainPallet:
     """残りパレット数計算のテスト"""
@@ -115,3 +124,40 @@ class TestCalculateRemainMinutes:
             plan=16000, actual=10000, production_type=2, decimals=1
         )
         assert result == 100.0
+
+
+class TestCalculateWithPreloadedConfig:
+    """取得済みの機種設定を渡した場合のテスト"""
+
+    CONFIG = ProductionTypeConfig(
+        production_type=5, name="テスト機種", fully=1000, seconds_per_product=3.0
+    )
+
+    @patch("backend.calculators.get_config_data")
+    def test_remain_pallet_uses_given_config(self, mock_get_config):
+        """configを渡すと機種設定を再取得しないか"""
+        result = calculate_remain_pallet(
+            plan=3000, actual=1000, production_type=5, config=self.CONFIG
+        )
+
+        assert result == 2.0
+        mock_get_config.assert_not_called()
+
+    @patch("backend.calculators.get_config_data")
+    def test_remain_minutes_uses_given_config(self, mock_get_config):
+        """configを渡すと機種設定を再取得しないか"""
+        result = calculate_remain_minutes(
+            plan=3000, actual=1000, production_type=5, config=self.CONFIG
+        )
+
+        assert result == 100.0
+        mock_get_config.assert_not_called()
+
+    @patch("backend.calculators.get_config_data")
+    def test_completed_plan_skips_config_lookup(self, mock_get_config):
+        """実績が計画以上なら機種設定を取得せず0を返すか"""
+        assert calculate_remain_pallet(plan=1000, actual=1000, production_type=5) == 0.0
+        assert (
+            calculate_remain_minutes(plan=1000, actual=1200, production_type=5) == 0.0
+        )
+        mock_get_config.assert_not_called()
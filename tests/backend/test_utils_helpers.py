@@ -1,9 +1,14 @@
 """backend.utilsのヘルパー関数テスト"""
 
+from collections.abc import Mapping
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from backend.config_helpers import get_kiosk_mode
 from backend.plc.plc_fetcher import (
+    ALARM_MSG_WORDS,
+    _decode_alarm_msg,
     _fetch_bit,
     _fetch_word,
     fetch_actual,
@@ -169,30 +174,31 @@ class TestFetchAlarmMsg:
         """正常にアラームメッセージを取得"""
         mock_client = MagicMock()
         # "ERROR" をワードデータとして表現 (ASCII: E=0x45, R=0x52, O=0x4F, R=0x52)
-        mock_client.read_words.return_value = [
-            0x4552,  # "ER"
-            0x524F,  # "RO"
-            0x5200,  # "R\x00"
-            0x0000,
-            0x0000,
-            0x0000,
-            0x0000,
-            0x0000,
-            0x0000,
-            0x0000,
-        ]
+        # "ERROR" をワードデータのバイト列として表現 (上位バイト→下位バイト)
+        mock_client.read_words_raw.return_value = b"ERROR" + b"\x00" * 27
 
         result = fetch_alarm_msg(mock_client, "D700")
 
         assert result == "ERROR"
-        mock_client.read_words.assert_called_once_with("D700", size=10)
+        mock_client.read_words_raw.assert_called_once_with("D700", size=16)
         mock_logger.warning.assert_not_called()
 
+    @patch("backend.plc.plc_fetcher.logger")
+    def test_fetch_alarm_msg_shift_jis(self, mock_logger):
+        """Shift_JISのアラームメッセージをデコードできるか"""
+        mock_client = MagicMock()
+        # "異常" (Shift_JIS: 0x88D9 0x8FED)
+        mock_client.read_words_raw.return_value = b"\x88\xd9\x8f\xed" + b"\x00" * 28
+
+        result = fetch_alarm_msg(mock_client, "D700")
+
+        assert result == "異常"
+
     @patch("backend.plc.plc_fetcher.logger")
     def test_fetch_alarm_msg_connection_error(self, mock_logger):
         """接続エラー時は空文字を返す"""
         mock_client = MagicMock()
-        mock_client.read_words.side_effect = ConnectionError("Connection failed")
+        mock_client.read_words_raw.side_effect = ConnectionError("Connection failed")
 
         result = fetch_alarm_msg(mock_client, "D700")
 
@@ -200,6 +206,24 @@ class TestFetchAlarmMsg:
         mock_logger.warning.assert_called_once()
 
 
+class TestDecodeAlarmMsg:
+    """_decode_alarm_msg関数のテスト"""
+
+    def test_decode_full_length_message(self):
+        """既定ワード数のデータをデコードできるか"""
+        data = [0x4552, 0x524F, 0x5200] + [0x0000] * (ALARM_MSG_WORDS - 3)
+        assert _decode_alarm_msg(data) == "ERROR"
+
+    def test_decode_without_null_terminator(self):
+        """NULL終端がない場合は全バイトを文字列にするか"""
+        data = [0x4142] * ALARM_MSG_WORDS
+        assert _decode_alarm_msg(data) == "AB" * ALARM_MSG_WORDS
+
+    def test_decode_other_length(self):
+        """既定以外のワード数でもデコードできるか"""
+        assert _decode_alarm_msg([0x4142, 0x4300]) == "ABC"
+
+
 class TestGetKioskMode:
     """get_kiosk_mode関数のテスト"""
 
@@ -216,7 +240,7 @@ class TestGetPlcDeviceDict:
         """PLCデバイス辞書が正しく返されるか"""
         result = get_plc_device_dict()
 
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
         assert "TIME_DEVICE" in result
         assert "PRODUCTION_TYPE_DEVICE" in result
         assert "PLAN_DEVICE" in result
@@ -231,3 +255,11 @@ class TestGetPlcDeviceDict:
 
         for key, value in result.items():
             assert isinstance(value, str), f"{key} should be string"
+
+    def test_get_plc_device_dict_is_cached_and_read_only(self):
+        """同一オブジェクトを返し、書き換えできないか"""
+        result = get_plc_device_dict()
+
+        assert get_plc_device_dict() is result
+        with pytest.raises(TypeError):
+            result["TIME_DEVICE"] = "D0"  # type: ignore[index]
@@ -1,6 +1,8 @@
 """ProductionConfigManagerのテスト"""
 
+import json
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -53,6 +55,47 @@ class TestProductionConfigManager:
         ):
             manager.get_config(99)
 
+    def test_get_config_raises_error_for_negative_type(self):
+        """負の機種番号でValueErrorが発生するか"""
+        manager = ProductionConfigManager()
+        with pytest.raises(
+            ValueError, match="production_type must be between 0 and 15"
+        ):
+            manager.get_config(-1)
+
+    def test_find_config_returns_same_object_as_get_config(self):
+        """find_config()がget_config()と同じ設定を返すか"""
+        manager = ProductionConfigManager()
+        assert manager.find_config(1) is manager.get_config(1)
+
+    @pytest.mark.parametrize("production_type", [-1, 16, 99])
+    def test_find_config_returns_none_for_out_of_range(self, production_type):
+        """範囲外の機種番号でNoneを返すか"""
+        manager = ProductionConfigManager()
+        assert manager.find_config(production_type) is None
+
+    def test_find_config_returns_none_for_unconfigured_type(self):
+        """未定義の機種番号でNoneを返すか"""
+        manager = ProductionConfigManager()
+        unconfigured = next(i for i in range(16) if i not in manager.get_all_configs())
+        assert manager.find_config(unconfigured) is None
+
+    def test_manager_has_no_instance_dict(self):
+        """__slots__によりインスタンス辞書を持たないか"""
+        manager = ProductionConfigManager()
+        assert not hasattr(manager, "__dict__")
+
+    def test_initialize_returns_singleton(self):
+        """initialize()が同じライン名なら既存インスタンスを返すか"""
+        manager = ProductionConfigManager()
+        assert ProductionConfigManager.initialize(manager.line_name) is manager
+
+    def test_initialize_rejects_different_line(self):
+        """initialize()が別のライン名での再初期化を拒否するか"""
+        ProductionConfigManager()
+        with pytest.raises(RuntimeError, match="already initialized"):
+            ProductionConfigManager.initialize("another_line")
+
     def test_get_all_configs_returns_dict(self):
         """get_all_configs()が辞書を返すか"""
         manager = ProductionConfigManager()
@@ -97,3 +140,19 @@ class TestProductionConfigManagerWithDifferentLine:
                 os.environ["LINE_NAME"] = original_line_name
             # シングルトンインスタンスをリセット
             ProductionConfigManager._instance = None
+
+    def test_invalid_json_raises_value_error(self):
+        """JSONの解析に失敗した場合ValueErrorに変換されるか"""
+        ProductionConfigManager._instance = None
+
+        try:
+            with (
+                patch(
+                    "config.production_config._json_loads",
+                    side_effect=json.JSONDecodeError("Expecting value", "", 0),
+                ),
+                pytest.raises(ValueError, match="Invalid JSON format"),
+            ):
+                ProductionConfigManager()
+        finally:
+            ProductionConfigManager._instance = None
@@ -3,9 +3,17 @@
 from unittest.mock import patch
 
 import pytest
+from dotenv import dotenv_values
 from pydantic import ValidationError
 
-from config.settings import Settings, PLCDeviceList
+from config.settings import (
+    PLCDeviceList,
+    Settings,
+    _env_file_exists,
+    _read_env_file,
+    get_plc_devices,
+    get_settings,
+)
 
 
 class TestSettings:
@@ -94,9 +102,55 @@ class TestPLCDeviceList:
         assert device_list.ACTUAL_DEVICE == "D300"
 
 
+class TestCachedSettingsAccessors:
+    """設定取得関数のキャッシュのテスト"""
+
+    def test_get_settings_returns_same_instance(self):
+        """get_settings()が2回目以降同じインスタンスを返すか"""
+        assert get_settings() is get_settings()
+
+    def test_get_plc_devices_returns_same_instance(self):
+        """get_plc_devices()が2回目以降同じインスタンスを返すか"""
+        assert get_plc_devices() is get_plc_devices()
+
+    @pytest.fixture
+    def clear_env_file_cache(self):
+        """.env解析結果のキャッシュをテスト前後でクリア"""
+        _read_env_file.cache_clear()
+        yield
+        _read_env_file.cache_clear()
+
+    def test_env_file_is_parsed_once(self, clear_env_file_cache):
+        """SettingsとPLCDeviceListで.envの解析結果を共有するか"""
+        with patch(
+            "config.settings.dotenv_values", wraps=dotenv_values
+        ) as mock_dotenv_values:
+            Settings()
+            PLCDeviceList()
+
+        mock_dotenv_values.assert_called_once()
+
+    def test_environment_variable_overrides_env_file(
+        self, clear_env_file_cache, monkeypatch
+    ):
+        """環境変数が.envの値より優先されるか"""
+        monkeypatch.setenv("LINE_NAME", "FROM_ENV")
+        values = {**dotenv_values(".env"), "LINE_NAME": "FROM_FILE"}
+
+        with patch("config.settings.dotenv_values", return_value=values):
+            assert Settings().LINE_NAME == "FROM_ENV"
+
+
 class TestSettingsEnvFileNotFound:
     """環境変数ファイルが見つからない場合のテスト"""
 
+    @pytest.fixture(autouse=True)
+    def clear_env_file_cache(self):
+        """.env存在確認のキャッシュをテスト前後でクリア"""
+        _env_file_exists.cache_clear()
+        yield
+        _env_file_exists.cache_clear()
+
     @patch("os.path.exists")
     def test_settings_raises_error_when_env_file_missing(self, mock_exists):
         """環境変数ファイルが見つからない場合にFileNotFoundErrorが発生するか"""
@@ -112,3 +166,11 @@ class TestSettingsEnvFileNotFound:
 
         with pytest.raises(FileNotFoundError, match=r".env file not found"):
             PLCDeviceList()
+
+    @patch("os.path.exists", return_value=True)
+    def test_env_file_check_is_cached(self, mock_exists):
+        """.envの存在確認が初回のみ行われるか"""
+        Settings()
+        PLCDeviceList()
+
+        mock_exists.assert_called_once_with(".env")
@@ -3,6 +3,7 @@
 フェイルセーフ機構のテスト。
 """
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +17,7 @@ class TestApiClientFailsafe:
     @pytest.fixture(autouse=True)
     def reset_cache(self):
         """テストごとにキャッシュをリセット"""
-        import frontend.api_client as api_client
+        from frontend import api_client
 
         api_client._last_production_data = None
         yield
@@ -34,7 +35,7 @@ class TestApiClientFailsafe:
 
     def test_fetch_production_caches_success(self, mock_settings):
         """成功時にデータがキャッシュされる"""
-        import frontend.api_client as api_client
+        from frontend import api_client
 
         mock_response_data = {
             "line_name": "TEST_LINE",
@@ -42,6 +43,7 @@ class TestApiClientFailsafe:
             "production_name": "テスト機種",
             "plan": 1000,
             "actual": 500,
+            "remain": 500,
             "in_operating": True,
             "remain_min": 30,
             "remain_pallet": 5.0,
@@ -56,7 +58,7 @@ class TestApiClientFailsafe:
                 mock_client = MagicMock()
                 mock_response = MagicMock()
                 mock_response.status_code = 200
-                mock_response.json.return_value = mock_response_data
+                mock_response.content = json.dumps(mock_response_data).encode()
                 mock_client.get.return_value = mock_response
                 mock_client.__enter__ = MagicMock(return_value=mock_client)
                 mock_client.__exit__ = MagicMock(return_value=False)
@@ -65,11 +67,12 @@ class TestApiClientFailsafe:
                 result = api_client.fetch_production_from_api()
 
                 assert result.line_name == "TEST_LINE"
+                assert result.timestamp == datetime(2025, 1, 1, 12, 0, 0)
                 assert api_client._last_production_data is not None
 
     def test_fetch_production_uses_cache_on_timeout(self, mock_settings):
         """タイムアウト時にキャッシュを使用"""
-        import frontend.api_client as api_client
+        from frontend import api_client
         from schemas import ProductionData
 
         # 先にキャッシュを設定
@@ -102,10 +105,13 @@ class TestApiClientFailsafe:
                 # キャッシュされたデータが返される
                 assert result.line_name == "CACHED_LINE"
                 assert "[キャッシュ]" in result.alarm_msg
+                # 前回値そのものは書き換えない
+                assert result is not cached_data
+                assert cached_data.alarm_msg == ""
 
     def test_fetch_production_returns_error_without_cache(self, mock_settings):
         """キャッシュなしでタイムアウトするとエラーデータを返す"""
-        import frontend.api_client as api_client
+        from frontend import api_client
 
         api_client._last_production_data = None  # キャッシュなし
 
@@ -125,7 +131,7 @@ class TestApiClientFailsafe:
 
     def test_is_restart_allowed(self, mock_settings):
         """再起動許可フラグの確認"""
-        import frontend.api_client as api_client
+        from frontend import api_client
 
         mock_settings.ALLOW_FRONTEND_RESTART = False
         with patch.object(api_client, "_settings", mock_settings):
@@ -134,3 +140,34 @@ class TestApiClientFailsafe:
         mock_settings.ALLOW_FRONTEND_RESTART = True
         with patch.object(api_client, "_settings", mock_settings):
             assert api_client.is_restart_allowed() is True
+
+
+class TestApiClientConnectionReuse:
+    """HTTPクライアント使い回しのテスト"""
+
+    def test_get_client_returns_shared_instance(self):
+        """_get_client()が毎回同じクライアントを返すか"""
+        from frontend import api_client
+
+        with (
+            patch.object(api_client, "_client", None),
+            patch("frontend.api_client.httpx.Client") as mock_client_cls,
+        ):
+            first = api_client._get_client()
+            second = api_client._get_client()
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+
+    def test_check_api_health_uses_head_request(self):
+        """ヘルスチェックが本文を受け取らないHEADで行われるか"""
+        from frontend import api_client
+
+        with patch("frontend.api_client._get_client") as mock_get_client:
+            mock_client = mock_get_client.return_value
+            mock_client.head.return_value = httpx.Response(200)
+
+            assert api_client.check_api_health() is True
+
+        mock_client.head.assert_called_once_with(api_client.PATH_HEALTH)
+        mock_client.get.assert_not_called()
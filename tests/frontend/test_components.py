@@ -1,6 +1,33 @@
 """frontend.componentsのテスト"""
 
-from frontend.components import get_status_info
+from datetime import datetime
+from unittest.mock import patch
+
+from frontend.components import (
+    get_gauge_figure,
+    get_status_info,
+    render_header,
+    render_production_panel,
+)
+from schemas import ProductionData
+
+
+def _make_data() -> ProductionData:
+    """テスト用の生産データを生成"""
+    return ProductionData(
+        line_name="TEST_LINE",
+        production_type=0,
+        production_name="テスト機種",
+        plan=1000,
+        actual=500,
+        in_operating=True,
+        remain_min=75,
+        remain_pallet=5.0,
+        fully=100,
+        alarm=False,
+        alarm_msg="",
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+    )
 
 
 class TestGetStatusInfo:
@@ -96,3 +123,73 @@ class TestGetStatusInfo:
 
         assert css_class == "status-alarm"
         assert status_text == "⚠ 異常発生"
+
+
+class TestGetGaugeFigure:
+    """get_gauge_figure関数のテスト"""
+
+    def test_same_bucket_reuses_figure(self):
+        """0.1%未満の差は同じ図を再利用するか"""
+        fig = get_gauge_figure(0.66661, theme="dark")
+
+        assert get_gauge_figure(0.66664, theme="dark") is fig
+        assert fig.data[0].value == 66.7
+
+    def test_number_format_unchanged(self):
+        """数値の表示形式を変えていないか (75%は"75%"のまま表示)"""
+        fig = get_gauge_figure(0.75, theme="dark")
+
+        assert fig.data[0].value == 75.0
+        assert fig.data[0].number.valueformat is None
+        assert fig.data[0].number.suffix == "%"
+
+    def test_alarm_and_theme_are_separate_entries(self):
+        """異常フラグ・テーマが異なれば別の図を返すか"""
+        base = get_gauge_figure(0.5, theme="dark", alarm=False)
+
+        assert get_gauge_figure(0.5, theme="dark", alarm=True) is not base
+        assert get_gauge_figure(0.5, theme="light", alarm=False) is not base
+
+    def test_transition_disabled(self):
+        """値更新時のアニメーションが無効化されているか"""
+        fig = get_gauge_figure(0.42, theme="dark")
+
+        assert fig.layout.transition.duration == 0
+
+
+class TestRenderBatching:
+    """描画関数がst.markdownを1回にまとめているかのテスト"""
+
+    @patch("frontend.components.st.columns")
+    @patch("frontend.components.st.markdown")
+    def test_header_single_markdown(self, mock_markdown, mock_columns):
+        """ヘッダーがst.columnsを使わず1回のst.markdownで描画されるか"""
+        render_header(_make_data())
+
+        mock_columns.assert_not_called()
+        mock_markdown.assert_called_once()
+        html = mock_markdown.call_args.args[0]
+        assert "TEST_LINE 生産進捗 - テスト機種" in html
+        assert "2025-01-01 12:00:00" in html
+
+    @patch("frontend.components.st.columns")
+    @patch("frontend.components.st.markdown")
+    def test_production_panel_single_markdown(self, mock_markdown, mock_columns):
+        """生産情報の2列が1回のst.markdownで描画されるか"""
+        render_production_panel(_make_data(), 0.5)
+
+        mock_columns.assert_not_called()
+        mock_markdown.assert_called_once()
+        html = mock_markdown.call_args.args[0]
+        assert "grid-template-columns: 1fr 1fr" in html
+        assert "投入数 / 生産数量" in html
+        assert "残り生産時間" in html
+        # 左列: 生産数量メトリクス
+        assert "500" in html
+        assert "1,000" in html
+        assert "width: 50.0%" in html
+        assert "10.0" in html  # 総PL = 1000 / 100
+        # 右列: 残り時間 (75分 = 01時間15分) とステータス
+        assert "01<span" in html
+        assert "15<span" in html
+        assert "status-ok" in html
@@ -1,6 +1,10 @@
 """frontend.stylesのテスト"""
 
-from frontend.styles import get_theme_colors
+from collections.abc import Mapping
+
+import pytest
+
+from frontend.styles import get_page_styles, get_theme_colors
 
 
 class TestGetThemeColors:
@@ -10,13 +14,13 @@ class TestGetThemeColors:
         """ダークテーマで辞書を返す"""
         colors = get_theme_colors(theme="dark")
 
-        assert isinstance(colors, dict)
+        assert isinstance(colors, Mapping)
 
     def test_light_theme_returns_dict(self):
         """ライトテーマで辞書を返す"""
         colors = get_theme_colors(theme="light")
 
-        assert isinstance(colors, dict)
+        assert isinstance(colors, Mapping)
 
     def test_default_is_dark_theme(self):
         """引数なしの場合はダークテーマ"""
@@ -99,6 +103,14 @@ class TestGetThemeColors:
 
         assert set(dark_colors.keys()) == set(light_colors.keys())
 
+    def test_colors_are_shared_and_read_only(self):
+        """色設定が呼び出し間で共有され、変更できないか"""
+        colors = get_theme_colors(theme="dark")
+
+        assert get_theme_colors(theme="dark") is colors
+        with pytest.raises(TypeError):
+            colors["bg_color"] = "#123456"  # type: ignore[index]
+
     def test_gauge_bar_color_is_consistent(self):
         """ゲージバー色は両テーマで同じ（緑系）"""
         dark_colors = get_theme_colors(theme="dark")
@@ -107,3 +119,29 @@ class TestGetThemeColors:
         # 両方とも #31c77f (緑色)
         assert dark_colors["gauge_bar"] == light_colors["gauge_bar"]
         assert dark_colors["gauge_bar"] == "#31c77f"
+
+
+class TestGetPageStyles:
+    """get_page_styles関数のテスト"""
+
+    def test_styles_use_theme_colors(self):
+        """テーマの背景色がCSSに含まれるか"""
+        css = get_page_styles(theme="light")
+
+        assert css.strip().startswith("<style>")
+        assert get_theme_colors(theme="light")["bg_color"] in css
+
+    def test_styles_are_cached_per_theme(self):
+        """同じテーマでは生成済みのCSSを再利用するか"""
+        assert get_page_styles(theme="dark") is get_page_styles(theme="dark")
+        assert get_page_styles(theme="dark") != get_page_styles(theme="light")
+
+    def test_styles_are_minified(self):
+        """コメントと空白を除去したCSSを返すか"""
+        css = get_page_styles(theme="dark")
+
+        assert "\n" not in css
+        assert "/*" not in css
+        assert css.endswith("</style>")
+        assert ".main>div{padding-top:2rem;}" in css
+        assert "padding:0.1rem 0;" in css  # 値の区切りの空白は残す
@@ -106,3 +106,24 @@ class TestProductionTypeConfig:
         assert json_data["name"] == "機種B"
         assert json_data["fully"] == 3000
         assert json_data["seconds_per_product"] == pytest.approx(1.0)
+
+    def test_derived_constants(self):
+        """計算用の派生値が正しく求められ、JSONには含まれないか"""
+        config = ProductionTypeConfig(
+            production_type=2,
+            name="機種B",
+            fully=2000,
+            seconds_per_product=1.5,
+        )
+
+        assert config.inv_fully == pytest.approx(1 / 2000)
+        assert config.minutes_per_product == pytest.approx(0.025)
+        assert "inv_fully" not in config.model_dump()
+        assert "minutes_per_product" not in config.model_dump()
+
+    def test_config_is_immutable(self):
+        """共有される機種設定が変更できないか"""
+        config = ProductionTypeConfig.example()
+
+        with pytest.raises(ValidationError):
+            config.fully = 1